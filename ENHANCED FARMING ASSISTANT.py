@@ -1,39 +1,145 @@
+import time
+START_TIME = time.perf_counter()  # Reference point for the startup benchmark
+
 import tkinter as tk
-from tkinter import messagebox, ttk
-import pandas as pd
+from tkinter import filedialog, messagebox, ttk
+import bisect
 import datetime
-from plyer import notification
-
-# Function to load CSV file
-def load_csv(file_path):
+import heapq
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+
+from farming_engine import (
+    CSV_PATH, KNOWLEDGE_PATH, CropKnowledge, LRUCache, benchmark_schedule_generation, build_suggestion_indexes,
+    crop_actions, crop_data, crop_knowledge, due_fertilizer_actions, fertilizer_index, file_signature,
+    find_matching_rows, import_data_libraries, load_dataset, load_plot_roster, normalize_key, parse_date,
+    plot_reminders, ranked_crops, use_crop_knowledge, watering_reminders, watering_schedule_key
+)
+
+# pandas is imported on the loader thread by farming_engine, plyer when a notification is sent
+
+# Run with --benchmark-startup to print time-to-first-window and time-to-first-search
+BENCHMARK_STARTUP = '--benchmark-startup' in sys.argv
+startup_times = {'imports': time.perf_counter() - START_TIME}
+
+# Function to record how long after launch a startup milestone was reached
+def record_startup_time(name):
+    if name not in startup_times:
+        startup_times[name] = time.perf_counter() - START_TIME
+
+# Function to show a desktop notification, importing plyer only when one is sent
+def notify(title, message, app_name):
+    from plyer import notification
+    notification.notify(title=title, message=message, app_name=app_name)
+
+# Function run on the worker thread; results go back to Tk through load_queue.
+# Only the files that changed are reloaded; current_df is used for the suggestions otherwise.
+def load_dataset_worker(signature, reload_data, reload_knowledge, current_df):
+    dataset = new_knowledge = suggestions = None
     try:
-        df = pd.read_csv(file_path)
-        return df
-    except FileNotFoundError:
-        print("File not found.")
-        return None
+        import_data_libraries()
+        record_startup_time('data_imports')
+        if reload_data:
+            dataset = load_dataset(CSV_PATH, signature)
     except Exception as e:
+        # Always answer, otherwise the poller waits forever with Search disabled
         print("Error occurred:", e)
-        return None
-
-# Function to find matching rows based on input data
-def find_matching_rows(df, data):
+    try:
+        if reload_knowledge:
+            new_knowledge = CropKnowledge(KNOWLEDGE_PATH)
+        table = dataset[0] if dataset is not None and dataset[0] is not None else current_df
+        kb = new_knowledge or crop_knowledge()
+        suggestions = build_suggestion_indexes(table, list(kb.crop_data) + list(kb.crop_actions))
+    except Exception as e:
+        print("Error occurred:", e)
+    load_queue.put((dataset, new_knowledge, suggestions))
+
+# Function to start a background load if the CSV or the knowledge base changed; returns True when a load is running
+def start_dataset_load(force=False):
+    global loading, dataset_signature, knowledge_signature
+    if loading:
+        return True
+    signature = file_signature(CSV_PATH)
+    new_knowledge_signature = file_signature(KNOWLEDGE_PATH)
+    reload_data = force or signature != dataset_signature
+    reload_knowledge = new_knowledge_signature != knowledge_signature
+    if not (reload_data or reload_knowledge):
+        return False
+
+    # Recorded now so a file that fails to load isn't retried until it changes again
+    dataset_signature, knowledge_signature = signature, new_knowledge_signature
+    loading = True
     if df is None:
-        return None
-    
-    data = [entry.strip().lower() for entry in data]  # Convert to lowercase and remove whitespace
-    matching_rows = df[
-        (df['State_Name'].str.strip().str.lower() == data[0]) &
-        (df['District_Name'].str.strip().str.lower() == data[1]) &
-        (df['Season'].str.strip().str.lower() == data[2])
-    ]
-    return matching_rows['Crop'] if 'Crop' in matching_rows.columns else pd.Series()
+        search_button.config(state=tk.DISABLED)
+        status_label.config(text="Loading dataset...")
+    else:
+        # Searches keep using the current table while the new one is built
+        status_label.config(text="Reloading data in the background...")
+    progress_bar.start(10)
+    threading.Thread(
+        target=load_dataset_worker, args=(signature, reload_data, reload_knowledge, df), daemon=True
+    ).start()
+    root.after(100, poll_dataset_load)
+    return True
+
+# Function to check the dataset and knowledge base files for changes every few seconds
+def watch_data_files():
+    start_dataset_load()
+    root.after(RELOAD_POLL_MS, watch_data_files)
+
+# Function to pick up the worker's result on the Tk main loop
+def poll_dataset_load():
+    global df, crop_index, yield_index, suggestion_indexes, loading, pending_search
+    try:
+        dataset, new_knowledge, suggestions = load_queue.get_nowait()
+    except queue.Empty:
+        root.after(100, poll_dataset_load)
+        return
+
+    # Everything is swapped here on the Tk thread between two events, so a search sees
+    # either the old tables or the new ones. The previous table is kept if a reload fails.
+    if dataset is not None and (dataset[0] is not None or df is None):
+        df, crop_index, yield_index = dataset
+    if new_knowledge is not None:
+        use_crop_knowledge(new_knowledge)
+        crop_info_cache.clear()
+        crop_menu.config(values=list(crop_actions.keys()))
+    if suggestions is not None:
+        suggestion_indexes = suggestions
+    search_cache.clear()
+    loading = False
+
+    progress_bar.stop()
+    status_label.config(text="Dataset ready." if df is not None else "Dataset could not be loaded.")
+    search_button.config(state=tk.NORMAL)
+    if pending_search:
+        pending_search = False
+        show_results()
+
+    if BENCHMARK_STARTUP:
+        run_startup_benchmark()
+
+# Function to time a first search once the dataset is ready, print the timings and exit
+def run_startup_benchmark():
+    record_startup_time('dataset_ready')
+    for entry, example in ((entry1, "Tamil Nadu"), (entry2, "Theni"), (entry3, "Kharif")):
+        entry.delete(0, tk.END)
+        entry.insert(0, example)
+    show_results()
+    result_textbox.update_idletasks()
+    record_startup_time('first_search')
+    print(json.dumps({name: round(seconds, 4) for name, seconds in startup_times.items()}))
+    root.destroy()
 
 # Function to display crop information
 def display_crop_info():
     crop_name = crop_entry.get()
-    if crop_name in crop_data:
-        crop_info = crop_data[crop_name]
+    crop_info = crop_info_cache.get(crop_name, lambda: crop_data.get(crop_name))
+    if crop_info is not None:
         crop_window = tk.Toplevel(root)
         crop_window.title("Crop Information")
         
@@ -43,52 +149,320 @@ def display_crop_info():
     else:
         messagebox.showerror("Error", "Crop not found in database.")
 
+# Function to list the crops for a search, best historical yield first
+def find_unique_crops(data):
+    crop_values = find_matching_rows(df, data, crop_index)
+    if crop_values is None or crop_values.empty:
+        return ()
+    unique_crops = crop_values.unique().astype(str)  # Filter out duplicate crop entries
+
+    ranked = ranked_crops(yield_index, *data)
+    lines = []
+    for rank, (crop, mean_yield, trend, variance, years) in enumerate(ranked, 1):
+        trend_text = f", trend {trend:+.3f}/yr" if trend == trend else ""  # NaN for a single year
+        lines.append(f"{rank}. {crop} - yield {mean_yield:.2f}/ha over {years} yr{trend_text}")
+    # Crops without usable area/production figures follow the ranked ones
+    ranked_names = {row[0] for row in ranked}
+    lines.extend(crop for crop in unique_crops if crop not in ranked_names)
+    return tuple(lines)
+
+# Function to get the crops for a search, through the search cache
+def search_crops(data):
+    return search_cache.get(tuple(normalize_key(entry) for entry in data), lambda: find_unique_crops(data))
+
+# Function to suggest a correction for each search field; returns the corrections and whether
+# each field that needed one had a single candidate
+def search_corrections(data):
+    corrections = []
+    unambiguous = True
+    for field, text in zip(('state', 'district', 'season'), data):
+        index = suggestion_indexes.get(field)
+        suggestions = index.suggest(text, limit=2) if index is not None else []
+        if suggestions and normalize_key(suggestions[0]) != normalize_key(text):
+            unambiguous = unambiguous and len(suggestions) == 1
+        elif not suggestions:
+            unambiguous = False
+        corrections.append(suggestions[0] if suggestions else text)
+    return corrections, unambiguous
+
+# Function to tell whether corrected search fields differ from what was typed
+def corrections_differ(corrections, data):
+    return [normalize_key(text) for text in corrections] != [normalize_key(text) for text in data]
+
+# Function to suggest corrections for search fields that don't match a known name
+def did_you_mean(data, corrections=None):
+    if corrections is None:
+        corrections, _ = search_corrections(data)
+    return f"\nDid you mean: {', '.join(corrections)}?" if corrections_differ(corrections, data) else ""
+
+# Function to refresh a field's dropdown with suggestions for what has been typed
+def update_suggestions(event, field):
+    index = suggestion_indexes.get(field)
+    if index is not None:
+        event.widget.config(values=index.suggest(event.widget.get()))
+
 # Function to show search results
-def show_results(df):
-  
+def show_results():
+    global pending_search
+    # Wait for the first load; later reloads happen in the background while searches use the current table
+    if df is None and start_dataset_load():
+        pending_search = True
+        return
+
     data = [entry1.get(), entry2.get(), entry3.get()]
-    crop_values = find_matching_rows(df, data)
+    unique_crops = ()
+    heading = ""
+    corrections = None
+    if df is not None:
+        unique_crops = search_crops(data)
+        # Retry a search with typos when every misspelt field has exactly one close name
+        if not unique_crops:
+            corrections, unambiguous = search_corrections(data)
+            if unambiguous and corrections_differ(corrections, data):
+                unique_crops = search_crops(corrections)
+                heading = f"Showing results for: {', '.join(corrections)}\n"
     
-    if not crop_values.empty:
-        unique_crops = crop_values.unique()  # Filter out duplicate crop entries
+    if unique_crops:
         result_textbox.delete(1.0, tk.END)
-        result_textbox.insert(tk.END, '\n'.join(unique_crops.astype(str)))
+        result_textbox.insert(tk.END, heading + '\n'.join(unique_crops))
         crop_entry_label.grid(row=7, column=0, columnspan=2, padx=5, pady=5)
         crop_entry.grid(row=8, column=0, columnspan=2, padx=5, pady=5)
     else:
         result_textbox.delete(1.0, tk.END)
-        result_textbox.insert(tk.END, "No matching rows found.")
+        result_textbox.insert(tk.END, "No matching rows found." + did_you_mean(data, corrections))
         crop_entry_label.grid(row=7, column=0, columnspan=2, padx=5, pady=5)
         crop_entry.grid(row=8, column=0, columnspan=2, padx=5, pady=5)
 
 
 
-# Function to calculate days since planting
-def calculate_days_since_planting(start_date):
+# Function to open the reminder database, creating it if needed
+def open_reminder_store(path):
+    connection = sqlite3.connect(path)
+    # WAL keeps writes crash-safe without blocking reads
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS reminders ("
+        "key TEXT PRIMARY KEY, due TEXT NOT NULL, title TEXT NOT NULL, "
+        "message TEXT NOT NULL, app_name TEXT NOT NULL)"
+    )
+    # Fired reminders are kept (fired = 1) so registering them again doesn't send them twice
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(reminders)")]
+    if 'fired' not in columns:
+        connection.execute("ALTER TABLE reminders ADD COLUMN fired INTEGER NOT NULL DEFAULT 0")
+    connection.execute("CREATE INDEX IF NOT EXISTS reminders_due ON reminders (due)")
+    # Last day each (crop, planting date) was checked for fertilizer actions
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS fertilizer_checks ("
+        "crop TEXT NOT NULL, planting_date TEXT NOT NULL, last_check TEXT NOT NULL, "
+        "PRIMARY KEY (crop, planting_date))"
+    )
+    # Fired reminders older than REMINDER_KEEP_FIRED can no longer be registered again
+    cutoff = datetime.datetime.now() - REMINDER_KEEP_FIRED
+    connection.execute("DELETE FROM reminders WHERE fired = 1 AND due < ?", (format_due(cutoff),))
+    connection.commit()
+    return connection
+
+# Function to format a due time so that string order matches time order in the database
+def format_due(due):
+    return due.strftime(REMINDER_TIME_FORMAT)
+
+# Function to put a reminder in the in-memory heap
+def push_reminder(key, due, title, message, app_name):
+    scheduled_reminders[key] = (due, title, message, app_name)
+    heapq.heappush(reminder_heap, (due, key))
+
+# Function to load the stored reminders due up to `until` that are not in the heap yet
+def load_reminders(until):
+    global reminders_loaded_until
+    if reminders_loaded_until is not None and until <= reminders_loaded_until:
+        return
+    query = "SELECT key, due, title, message, app_name FROM reminders WHERE fired = 0 AND due <= ?"
+    params = [format_due(until)]
+    if reminders_loaded_until is not None:
+        query += " AND due > ?"
+        params.append(format_due(reminders_loaded_until))
+    for key, due, title, message, app_name in reminder_db.execute(query, params):
+        due = datetime.datetime.strptime(due, REMINDER_TIME_FORMAT)
+        push_reminder(tuple(json.loads(key)), due, title, message, app_name)
+    reminders_loaded_until = until
+
+# Function to register reminders given as (key, due, title, message, app_name).
+# Registering a key again with a new due time replaces it; with the same due time it is
+# ignored, even if that reminder has already fired.
+def schedule_reminders(reminders):
+    reminders = [
+        reminder for reminder in reminders
+        if reminder[0] not in scheduled_reminders or scheduled_reminders[reminder[0]][0] != reminder[1]
+    ]
+    if not reminders:
+        return  # Already scheduled
+    reminder_db.executemany(
+        "INSERT INTO reminders (key, due, title, message, app_name) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET due = excluded.due, title = excluded.title, "
+        "message = excluded.message, app_name = excluded.app_name, fired = 0 "
+        "WHERE reminders.due != excluded.due",
+        [(json.dumps(key), format_due(due), title, message, app_name)
+         for key, due, title, message, app_name in reminders]
+    )
+
+    # Only reminders inside the loaded window are kept in memory; the rest load when their day comes
+    for key, due, title, message, app_name in reminders:
+        if reminders_loaded_until is not None and due <= reminders_loaded_until:
+            fired = reminder_db.execute("SELECT fired FROM reminders WHERE key = ?", (json.dumps(key),)).fetchone()
+            if not fired[0]:
+                push_reminder(key, due, title, message, app_name)
+        else:
+            scheduled_reminders.pop(key, None)
+    arm_reminder_timer()
+
+# Function to register the reminders of one schedule, whose keys all start with `prefix`.
+# Pending reminders of that schedule which are not registered again are dropped.
+def replace_reminders(prefix, reminders):
+    reminders = list(reminders)
+    keep = {json.dumps(reminder[0]) for reminder in reminders}
+    # Stored keys are JSON lists, so the schedule's keys all start with the prefix list minus its "]"
+    pattern = json.dumps(list(prefix))[:-1] + ", "
+    stale = [
+        key for (key,) in reminder_db.execute(
+            "SELECT key FROM reminders WHERE fired = 0 AND substr(key, 1, ?) = ?", (len(pattern), pattern)
+        )
+        if key not in keep
+    ]
+    reminder_db.executemany("DELETE FROM reminders WHERE key = ?", [(key,) for key in stale])
+    # Their heap entries are skipped once they are no longer in scheduled_reminders
+    for key in stale:
+        scheduled_reminders.pop(tuple(json.loads(key)), None)
+    schedule_reminders(reminders)
+
+# Function to register a single reminder
+def schedule_reminder(key, due, title, message, app_name):
+    schedule_reminders([(key, due, title, message, app_name)])
+
+# Function to set a single timer for the earliest due reminder
+def arm_reminder_timer():
+    global reminder_timer
+    if reminder_timer is not None:
+        root.after_cancel(reminder_timer)
+        reminder_timer = None
+
+    # Drop heap entries whose reminder was replaced or already fired
+    while reminder_heap and scheduled_reminders.get(reminder_heap[0][1], (None,))[0] != reminder_heap[0][0]:
+        heapq.heappop(reminder_heap)
+
+    # Wake for the next reminder, the end of the loaded window, or after MAX_REMINDER_SLEEP_MS
+    # at the latest so clock changes and sleep/resume are noticed
+    wake = reminders_loaded_until
+    if reminder_heap and (wake is None or reminder_heap[0][0] < wake):
+        wake = reminder_heap[0][0]
+    delay_ms = MAX_REMINDER_SLEEP_MS
+    if wake is not None:
+        delay = (wake - datetime.datetime.now()).total_seconds()
+        delay_ms = min(max(int(delay * 1000), 0), MAX_REMINDER_SLEEP_MS)
+    reminder_timer = root.after(delay_ms, fire_due_reminders)
+
+# Function to build the text of one notification from its (key, message) reminders.
+# Plot reminders ("Plot <id>: <text>") with the same text become one line listing the plots.
+def notification_text(reminders):
+    plots = {}
+    for key, message in reminders:
+        prefix = f"Plot {key[1]}: " if key[0] in ('plot-water', 'plot-fertilize') else None
+        if prefix is not None and message.startswith(prefix):
+            # A plot missed on several days is listed once
+            plots.setdefault(message[len(prefix):], {})[key[1]] = None
+        else:
+            plots.setdefault(message, None)
+
+    lines = []
+    for text, plot_ids in plots.items():
+        plot_ids = list(plot_ids or ())
+        if not plot_ids:
+            lines.append(text)
+        elif len(plot_ids) == 1:
+            lines.append(f"Plot {plot_ids[0]}: {text}")
+        else:
+            shown = ", ".join(plot_ids[:NOTIFY_MAX_PLOTS]) + (", ..." if len(plot_ids) > NOTIFY_MAX_PLOTS else "")
+            lines.append(f"{len(plot_ids)} plots ({shown}): {text}")
+    return "\n".join(lines)
+
+# Function to send every reminder that is due, each exactly once
+def fire_due_reminders():
+    global reminder_timer
+    reminder_timer = None
+    # The timer is re-armed even if something below fails, so later reminders still fire
     try:
-        start_date_obj = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        today = datetime.datetime.now().date()
-        days_diff = (today - start_date_obj).days
-        return days_diff
-    except ValueError:
-        return None
-    
-    
+        now = datetime.datetime.now()
+        load_reminders(now + REMINDER_LOAD_WINDOW)
+
+        due_now = {}
+        while reminder_heap and reminder_heap[0][0] <= now:
+            due, key = heapq.heappop(reminder_heap)
+            entry = scheduled_reminders.get(key)
+            if entry is None or entry[0] != due:
+                continue
+            del scheduled_reminders[key]
+            due_now.setdefault((entry[1], entry[3]), []).append((key, entry))
+
+        # Reminders missed while the app was closed are sent once per title. They are only
+        # marked fired once the notification went out; a failed one is retried later.
+        for (title, app_name), group in due_now.items():
+            try:
+                notify(title, notification_text([(key, entry[2]) for key, entry in group]), app_name)
+            except Exception as e:
+                # No notification backend (or no plyer) must not stop the scheduler
+                print("Could not send notification:", e)
+                for key, entry in group:
+                    push_reminder(key, now + REMINDER_RETRY, *entry[1:])
+                continue
+            with reminder_db:
+                reminder_db.executemany(
+                    "UPDATE reminders SET fired = 1 WHERE key = ?", [(json.dumps(key),) for key, _ in group]
+                )
+    finally:
+        arm_reminder_timer()
 
 # Function to check reminder for fertilization
 def check_fertilizer_reminder():
     crop = crop_var.get()
     start_date = start_date_entry.get()
-    days_since_planting = calculate_days_since_planting(start_date)
-    
-    if days_since_planting is not None and days_since_planting in crop_actions[crop]:
-        action = crop_actions[crop][days_since_planting]
-        messagebox.showinfo("Fertilizer Reminder", action)
+    try:
+        planting_date = parse_date(start_date)
+    except ValueError:
+        planting_date = None
+
+    # Report everything that became due since the last check, so a missed day isn't a missed action
+    due = []
+    if planting_date is not None:
+        today = datetime.date.today()
+        row = reminder_db.execute(
+            "SELECT last_check FROM fertilizer_checks WHERE crop = ? AND planting_date = ?", (crop, start_date)
+        ).fetchone()
+        # The last check already reported its own day, so start the day after it
+        since = parse_date(row[0]) + datetime.timedelta(days=1) if row else planting_date
+        due = due_fertilizer_actions([(None, crop, planting_date)], since, today)
+        with reminder_db:
+            reminder_db.execute(
+                "INSERT OR REPLACE INTO fertilizer_checks VALUES (?, ?, ?)",
+                (crop, start_date, today.strftime("%Y-%m-%d"))
+            )
+
+    if due:
+        message = "\n".join(f"Day {day}: {action}" for _, day, action in due)
+        messagebox.showinfo("Fertilizer Reminder", message)
     else:
         messagebox.showinfo("Fertilizer Reminder", f"No fertilizer action for {crop} today.")
 
-    # Schedule the next reminder
-    root.after(86400000, check_fertilizer_reminder)  # 86400000 milliseconds = 1 day
+    # Schedule notifications for the upcoming actions instead of re-checking every day
+    if planting_date is not None:
+        offsets, actions = fertilizer_index.get(crop, ((), ()))
+        first = bisect.bisect_right(offsets, (datetime.date.today() - planting_date).days)
+        planting_time = datetime.datetime.combine(planting_date, datetime.time())
+        with reminder_db:
+            schedule_reminders(
+                (('fertilize', crop, start_date, offset), planting_time + datetime.timedelta(days=offset),
+                 f"Fertilize {crop}", action, 'Crop Fertilizer Reminder')
+                for offset, action in zip(offsets[first:], actions[first:])
+            )
 
 # Function to set watering reminder
 def set_watering_reminder():
@@ -106,878 +480,86 @@ def set_watering_reminder():
         messagebox.showerror("Error", "End date must be after start date.")
         return
 
-    # Calculate the reminder dates
-    reminder_dates = []
-    current_date = start_date_obj
-    while current_date <= end_date_obj:
-        reminder_dates.append(current_date)
-        current_date += datetime.timedelta(days=schedule_days)
-
-    # Send notifications on reminder dates
-    for date in reminder_dates:
-        notification_title = f"Water {crop_name}"
-        notification_message = f"Don't forget to water your {crop_name} today!"
-        notification.notify(
-            title=notification_title,
-            message=notification_message,
-            app_name='Crop Watering Reminder'
-        )
+    if schedule_days <= 0:
+        messagebox.showerror("Error", "Watering schedule must be at least 1 day.")
+        return
+
+    # Schedule a notification for each reminder date from today on, replacing this planting's old schedule
+    date_strings, reminders = watering_reminders(crop_name, start_date_obj, end_date_obj, schedule_days,
+                                                 datetime.date.today())
+    with reminder_db:
+        replace_reminders(watering_schedule_key(crop_name, start_date_obj), reminders)
 
     # Show success message
-    success_message = f"Reminders set for {crop_name}:\n"
-    for date in reminder_dates:
-        success_message += f"- {date.strftime('%Y-%m-%d')}\n"
-    messagebox.showinfo("Success", success_message)
-    root.after(86400000, set_watering_reminder) 
-
-# Load CSV file
-df = load_csv(r"D:\MINIPROJECT CSV\crop_production.csv.csv")
-
-# Crop Information Dictionary
-crop_data = {
-    "Arhar/Tur": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Before sowing, during flowering and pod formation",
-        "Harvesting Time": "90-150 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-4 cm",
-        "Planting Distance": "Rows spaced 60-90 cm apart, with 10-15 cm between plants"
-    },
-    "Bajra": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-80 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 5-10 cm between plants"
-    },
-    "Banana": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Regularly throughout the year",
-        "Harvesting Time": "9-12 months after planting",
-        "Planting Procedure": "Plant suckers at a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 3-4 meters apart"
-    },
-    "Cardamom": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good organic matter",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-4 years after planting",
-        "Planting Procedure": "Plant rhizomes in pits of 40 cm depth with a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 2-3 meters apart"
-    },
-    "Cashewnut": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "First two years after planting",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant seeds or grafted seedlings at a spacing of 8-10 meters between plants",
-        "Planting Distance": "Rows spaced 8-10 meters apart"
-    },
-    "Castor seed": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "5-6 months after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-5 cm",
-        "Planting Distance": "Rows spaced 90-120 cm apart, with 20-30 cm between plants"
-    },
-    "Coriander": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Once at the time of sowing",
-        "Harvesting Time": "45-70 days after sowing",
-        "Planting Procedure": "Broadcast seeds or sow in furrows at a depth of 1-2 cm",
-        "Planting Distance": "Rows spaced 20-30 cm apart"
-    },
-    "Cotton(lint)": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "170-220 days after sowing",
-        "Planting Procedure": "Sow seeds at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 90-120 cm apart, with 30-45 cm between plants"
-    },
-    "Dry chillies": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "90-100 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 30-45 cm between plants"
-    },
-    "Groundnut": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Sow seeds in ridges or flatbeds at a depth of 5-10 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 15-20 cm between plants"
-    },
-    "Jowar": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "100-120 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 10-15 cm between plants"
-    },
-    "Maize": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "70-80 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-5 cm",
-        "Planting Distance": "Rows spaced 60-75 cm apart, with 20-30 cm between plants"
-    },
-    "Moong(Green Gram)": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "60-75 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-4 cm",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 10-15 cm between plants"
-    },
-    "Onion": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during bulb formation",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Plant bulbs or sets at a depth of 1-2 cm",
-        "Planting Distance": "Rows spaced 15-30 cm apart, with 10-15 cm between plants"
-    },
-    "Pulses total": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "Varies depending on the pulse variety",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-5 cm",
-        "Planting Distance": "Varies depending on the pulse variety"
-    },
-    "Ragi": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 20-30 cm apart, with 10-15 cm between plants"
-    },
-    "Rice": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Clayey soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation, at sowing, and during tillering",
-        "Harvesting Time": "120-150 days after sowing",
-        "Planting Procedure": "Transplant seedlings in puddled soil",
-        "Planting Distance": "Rows spaced 20-30 cm apart, with 15-20 cm between plants"
-    },
-    "Sugarcane": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation and at regular intervals",
-        "Harvesting Time": "10-12 months after planting",
-        "Planting Procedure": "Plant setts or cuttings in furrows at a spacing of 0.9-1.2 meters",
-        "Planting Distance": "Rows spaced 1.5-1.8 meters apart"
-    },
-    "Sunflower": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 20-30 cm between plants"
-    },
-    "Sweet potato": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Once at the time of planting",
-        "Harvesting Time": "3-5 months after planting",
-        "Planting Procedure": "Plant vine cuttings or slips at a depth of 5-10 cm",
-        "Planting Distance": "Rows spaced 60-90 cm apart, with 30-45 cm between plants"
-    },
-    "Tapioca": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Once at the time of planting",
-        "Harvesting Time": "8-10 months after planting",
-        "Planting Procedure": "Plant stem cuttings horizontally in furrows at a spacing of 45-60 cm",
-        "Planting Distance": "Rows spaced 90-120 cm apart"
-    },
-    "Tobacco": {
-        "Watering Schedule": {"Frequency": "Every 6 days", "Number of Days": 6},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation and after transplanting",
-        "Harvesting Time": "90-120 days after transplanting",
-        "Planting Procedure": "Transplant seedlings in rows spaced 60-90 cm apart",
-        "Planting Distance": "Rows spaced 60-90 cm apart, with 45-60 cm between plants"
-    },
-    "Total foodgrain": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "Varies depending on the grain",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-5 cm",
-        "Planting Distance": "Varies depending on the grain"
-    },
-    "Turmeric": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Once at the time of planting",
-        "Harvesting Time": "8-10 months after planting",
-        "Planting Procedure": "Plant rhizomes in pits of 20-30 cm depth with a spacing of 30-45 cm between plants",
-        "Planting Distance": "Rows spaced 45-60 cm apart"
-    },
-    "Urad": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "70-90 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 3-4 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 10-15 cm between plants"
-    },
-    "Black pepper": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good organic matter",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-4 years after planting",
-        "Planting Procedure": "Plant cuttings or rooted vine segments in pits of 50 cm depth with a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 2-3 meters apart"
-    },
-    "Guar seed": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-110 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 15-20 cm between plants"
-    },
-    "Potato": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation and after planting",
-        "Harvesting Time": "90-120 days after planting",
-        "Planting Procedure": "Plant seed tubers in trenches or furrows at a spacing of 30-45 cm",
-        "Planting Distance": "Rows spaced 60-75 cm apart"
-    },
-    "Arecanut": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Two to three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant suckers or seedlings at a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 3-4 meters apart"
-    },
-    "Ash Gourd": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "80-100 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 90-120 cm apart, with 60-75 cm between plants"
-    },
-    "Beans & Mutter(Vegetable)": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-80 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 15-20 cm between plants"
-    },
-    "Beet Root": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Loamy soil with good organic matter",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "50-70 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 5-10 cm between plants"
-    },
-    "Bhindi": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "45-60 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 30-45 cm between plants"
-    },
-    "Bitter Gourd": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "45-60 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 150-180 cm apart, with 60-75 cm between plants"
-    },
-    "Bottle Gourd": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "45-60 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 180-210 cm apart, with 60-75 cm between plants"
-    },
-    "Brinjal": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-75 days after transplanting",
-        "Planting Procedure": "Transplant seedlings",
-        "Planting Distance": "Rows spaced 60-75 cm apart, with 45-60 cm between plants"
-    },
-    "Cabbage": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-90 days after transplanting",
-        "Planting Procedure": "Transplant seedlings",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 30-45 cm between plants"
-    },
-    "Cauliflower": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-90 days after transplanting",
-        "Planting Procedure": "Transplant seedlings",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 30-45 cm between plants"
-    },
-    "Citrus Fruit": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Four times a year",
-        "Harvesting Time": "Varies depending on the citrus variety",
-        "Planting Procedure": "Plant grafted seedlings in pits of 45-60 cm depth with a spacing of 5-6 meters between plants",
-        "Planting Distance": "Rows spaced 5-6 meters apart"
-    },
-    "Coconut": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Twice a year",
-        "Harvesting Time": "5-6 years after planting",
-        "Planting Procedure": "Plant seedlings in pits of 60-90 cm depth with a spacing of 7-9 meters between plants",
-        "Planting Distance": "Rows spaced 7-9 meters apart"
-    },
-    "Cucumber": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "45-60 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 60-75 cm apart, with 30-45 cm between plants"
-    },
-    "Drum Stick": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation and at regular intervals",
-        "Harvesting Time": "9-12 months after planting",
-        "Planting Procedure": "Plant seeds or seedlings at a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 3-4 meters apart"
-    },
-    "Grapes": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During the growing season",
-        "Harvesting Time": "2-3 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 60-90 cm depth with a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 2-3 meters apart"
-    },
-    "Jack Fruit": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "During land preparation and at regular intervals",
-        "Harvesting Time": "4-6 years after planting",
-        "Planting Procedure": "Plant seeds or seedlings in pits of 90-120 cm depth with a spacing of 8-10 meters between plants",
-        "Planting Distance": "Rows spaced 8-10 meters apart"
-    },
-    "Lab-Lab": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "70-90 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 60-75 cm apart, with 30-45 cm between plants"
-    },
-    "Mango": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 1 meter depth with a spacing of 8-10 meters between plants",
-        "Planting Distance": "Rows spaced 8-10 meters apart"
-    },
-    "Orange": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 60-90 cm depth with a spacing of 6-7 meters between plants",
-        "Planting Distance": "Rows spaced 6-7 meters apart"
-    },
-    "Other Citrus Fruit": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "Varies depending on the citrus variety",
-        "Planting Procedure": "Plant grafted seedlings in pits of 45-60 cm depth with a spacing of 5-6 meters between plants",
-        "Planting Distance": "Rows spaced 5-6 meters apart"
-    },
-    "Other Fresh Fruits": {
-        "Watering Schedule": {"Frequency": "Varies", "Number of Days": "Varies"},
-        "Soil Requirements": "Varies",
-        "Fertilizer": "Varies",
-        "Fertilization Period": "Varies",
-        "Harvesting Time": "Varies",
-        "Planting Procedure": "Varies",
-        "Planting Distance": "Varies"
-    },
-    "Other Vegetables": {
-        "Watering Schedule": {"Frequency": "Varies", "Number of Days": "Varies"},
-        "Soil Requirements": "Varies",
-        "Fertilizer": "Varies",
-        "Fertilization Period": "Varies",
-        "Harvesting Time": "Varies",
-        "Planting Procedure": "Varies",
-        "Planting Distance": "Varies"
-    },
-    "Papaya": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "7-9 months after planting",
-        "Planting Procedure": "Plant seeds or seedlings in pits of 45-60 cm depth with a spacing of 2-3 meters between plants",
-        "Planting Distance": "Rows spaced 2-3 meters apart"
-    },
-    "Pome Fruit": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 60-90 cm depth with a spacing of 6-7 meters between plants",
-        "Planting Distance": "Rows spaced 6-7 meters apart"
-    },
-    "Pome Granet": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 60-90 cm depth with a spacing of 6-7 meters between plants",
-        "Planting Distance": "Rows spaced 6-7 meters apart"
-    },
-    "Pump Kin": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Direct sow seeds",
-        "Planting Distance": "Rows spaced 180-210 cm apart, with 90-120 cm between plants"
-    },
-    "Ribed Guard": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-80 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 180-210 cm apart, with 90-120 cm between plants"
-    },
-    "Snak Guard": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-80 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 180-210 cm apart, with 90-120 cm between plants"
-    },
-    "Tomato": {
-        "Watering Schedule": {"Frequency": "Every 2 days", "Number of Days": 2},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "60-80 days after transplanting",
-        "Planting Procedure": "Transplant seedlings",
-        "Planting Distance": "Rows spaced 60-75 cm apart, with 30-45 cm between plants"
-    },
-    "Water Melon": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "70-90 days after sowing",
-        "Planting Procedure": "Direct sow seeds or transplant seedlings",
-        "Planting Distance": "Rows spaced 180-210 cm apart, with 90-120 cm between plants"
-    },
-    "Yam": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "6-8 months after planting",
-        "Planting Procedure": "Plant tubers in pits or mounds",
-        "Planting Distance": "Rows spaced 90-120 cm apart, with 60-75 cm between plants"
-    },
-    "Plums": {
-        "Watering Schedule": {"Frequency": "Every 7 days", "Number of Days": 7},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "Three times a year",
-        "Harvesting Time": "3-5 years after planting",
-        "Planting Procedure": "Plant grafted seedlings in pits of 60-90 cm depth with a spacing of 6-7 meters between plants",
-        "Planting Distance": "Rows spaced 6-7 meters apart"
-    },
-    "Redish": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Loamy soil with good drainage",
-        "Fertilizer": "Organic manure, Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "30-45 days after sowing",
-        "Planting Procedure": "Direct sow seeds",
-        "Planting Distance": "Rows spaced 15-20 cm apart, with 5-10 cm between plants"
-    },
-    "Horse-gram": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-110 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 10-15 cm between plants"
-    },
-    "Sesamum": {
-        "Watering Schedule": {"Frequency": "Every 4 days", "Number of Days": 4},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-120 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 45-60 cm apart, with 15-20 cm between plants"
-    },
-    "Small millets": {
-        "Watering Schedule": {"Frequency": "Every 3 days", "Number of Days": 3},
-        "Soil Requirements": "Well-drained loamy soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during growth stages",
-        "Harvesting Time": "70-90 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 15-20 cm apart, with 5-10 cm between plants"
-    },
-    "Gram": {
-        "Watering Schedule": {"Frequency": "Every 5 days", "Number of Days": 5},
-        "Soil Requirements": "Sandy loam soil",
-        "Fertilizer": "Nitrogen, Phosphorus, Potassium",
-        "Fertilization Period": "At sowing and during flowering",
-        "Harvesting Time": "90-110 days after sowing",
-        "Planting Procedure": "Sow seeds directly into the soil at a depth of 2-3 cm",
-        "Planting Distance": "Rows spaced 30-45 cm apart, with 10-15 cm between plants"
-    }
-}
-
-# Fertilizer Schedule Dictionary
-crop_actions = {
-    # Include fertilizer schedule for crops
-    "Arhar/Tur": {
-        0: "Apply phosphorus and potassium fertilizer (e.g., 10-26-26) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Bajra": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        20: "Side-dress with nitrogen fertilizer."
-    },
-    "Banana": {
-        0: "Apply a balanced fertilizer (e.g., 6-6-12) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Cardamom": {
-        0: "Apply a slow-release fertilizer at planting time.",
-        90: "Apply organic fertilizer or compost."
-    },
-    "Cashewnut": {
-        0: "Apply a balanced fertilizer (e.g., 12-6-12) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Castor seed": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Coriander": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        15: "Apply nitrogen fertilizer (e.g., urea)."
-    },
-    "Cotton(lint)": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Dry chillies": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        20: "Side-dress with nitrogen fertilizer."
-    },
-    "Groundnut": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Jowar": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        20: "Side-dress with nitrogen fertilizer."
-    },
-    "Maize": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Moong(Green Gram)": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Onion": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Ragi": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Rice": {
-        0: "Apply nitrogen fertilizer (e.g., urea) at planting time.",
-        20: "Apply a topdressing of nitrogen fertilizer."
-    },
-    "Sugarcane": {
-        0: "Apply a balanced fertilizer (e.g., 12-32-16) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Sunflower": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Sweet potato": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Tapioca": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Tobacco": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Turmeric": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Urad": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Black pepper": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Apply organic compost."
-    },
-    "Guar seed": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Potato": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Hill-up soil and side-dress with nitrogen fertilizer."
-    },
-    "Arecanut": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Ash Gourd": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Beans & Mutter(Vegetable)": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer and provide support."
-    },
-    "Beet Root": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Bhindi": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer and provide support."
-    },
-    "Bitter Gourd": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer and provide support."
-    },
-    "Bottle Gourd": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer and provide support."
-    },
-    "Brinjal": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer and provide support."
-    },
-    "Cabbage": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Cauliflower": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Citrus Fruit": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Coconut": {
-        0: "Apply a balanced fertilizer (e.g., 12-6-12) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Cucumber": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        20: "Side-dress with nitrogen fertilizer."
-    },
-    "Drum Stick": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Apply organic compost."
-    },
-    "Grapes": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        90: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Jack Fruit": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Lab-Lab": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a balanced slow-release fertilizer."
-    },
-    "Mango": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Orange": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Papaya": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Pome Fruit": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Pome Granet": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Pump Kin": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Ribed Guard": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Snak Guard": {
-         0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-     },
-    "Tomato": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        7: "Water-soluble fertilizer with higher nitrogen content (e.g., 20-10-10).",
-        14: "Apply a balanced slow-release fertilizer around the base of each plant.",
-        21: "Water-soluble fertilizer with balanced nutrients (e.g., 15-15-15).",
-        28: "Apply a fertilizer high in phosphorus and potassium (e.g., 5-10-10) to promote flowering and fruiting.",
-        35: "Water-soluble fertilizer with micronutrients (e.g., iron, magnesium) for overall plant health.",
-        42: "Apply compost or organic fertilizer to replenish soil nutrients.",
-        49: "Water-soluble fertilizer with calcium to prevent blossom end rot.",
-        56: "Apply a balanced slow-release fertilizer to sustain plant growth.",
-        63: "Water-soluble fertilizer with higher potassium content (e.g., 10-20-20) to support fruit development.",
-        70: "Apply compost tea or liquid seaweed fertilizer for additional micronutrients.",
-        77: "Water-soluble fertilizer with a balanced nutrient profile to maintain plant vigor.",
-        84: "Apply a final dose of slow-release fertilizer to sustain the plant until harvest.",
-        91: "Water-soluble fertilizer with low nitrogen content to avoid excessive vegetative growth before harvest."
-    },
-    "Water Melon": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Yam": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Plums": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        60: "Apply a fertilizer high in potassium (e.g., 0-0-50)."
-    },
-    "Redish": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Horse-gram": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Sesamum": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Small millets": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    },
-    "Gram": {
-        0: "Apply a balanced fertilizer (e.g., 10-10-10) at planting time.",
-        30: "Side-dress with nitrogen fertilizer."
-    }
-}
+    messagebox.showinfo("Success", summarize_dates(f"Reminders set for {crop_name}:", date_strings))
+
+# Function to list dates under a heading, only rendering the first SUMMARY_MAX_DATES of them
+def summarize_dates(heading, date_strings):
+    lines = [heading]
+    lines.extend(f"- {day}" for day in date_strings[:SUMMARY_MAX_DATES])
+    if len(date_strings) > SUMMARY_MAX_DATES:
+        lines.append(f"... and {len(date_strings) - SUMMARY_MAX_DATES} more")
+    return "\n".join(lines) + "\n"
+
+# Pending reminders: a min-heap of (due, key) plus the current entry for each key.
+# All reminders are stored in reminder_db; the heap only holds those due before reminders_loaded_until.
+REMINDER_DB_PATH = os.path.join(os.path.expanduser("~"), ".farming_assistant_reminders.db")
+REMINDER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+REMINDER_LOAD_WINDOW = datetime.timedelta(days=1)
+REMINDER_KEEP_FIRED = datetime.timedelta(days=2)
+REMINDER_RETRY = datetime.timedelta(minutes=10)
+NOTIFY_MAX_PLOTS = 10
+MAX_REMINDER_SLEEP_MS = 60 * 60 * 1000
+SUMMARY_MAX_DATES = 30
+reminder_db = open_reminder_store(REMINDER_DB_PATH)
+reminder_heap = []
+scheduled_reminders = {}
+reminders_loaded_until = None
+reminder_timer = None
+
+# Function to load a plot roster chosen by the user and schedule all of its reminders
+def load_plot_roster_file():
+    file_path = filedialog.askopenfilename(title="Select plot roster", filetypes=[("CSV files", "*.csv")])
+    if not file_path:
+        return
+    try:
+        roster, skipped = load_plot_roster(file_path)
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Could not read plot roster: {e}")
+        return
+
+    today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    reminders = plot_reminders(roster, today)
+    with reminder_db:
+        schedule_reminders(reminders)
+
+    message = f"Scheduled {len(reminders)} reminders for {len(roster)} plots."
+    if skipped:
+        message += f"\nSkipped {skipped} rows with missing or invalid data."
+    messagebox.showinfo("Success", message)
+
+# Dataset and search index, filled in by the background loader
+df = None
+crop_index = {}
+yield_index = {}
+suggestion_indexes = {}
+dataset_signature = None
+knowledge_signature = file_signature(KNOWLEDGE_PATH)
+load_queue = queue.Queue()
+
+# How often the dataset and knowledge base files are checked for changes
+RELOAD_POLL_MS = 5000
+
+# Results of recent searches and crop lookups; both are cleared when the data they came from reloads
+search_cache = LRUCache(maxsize=256, ttl=24 * 60 * 60)
+crop_info_cache = LRUCache(maxsize=128)
+loading = False
+pending_search = False
+
+# Run with --benchmark-schedule to time schedule generation without opening the GUI
+if '--benchmark-schedule' in sys.argv:
+    benchmark_schedule_generation()
+    sys.exit()
 
 # Create GUI
 root = tk.Tk()
@@ -992,7 +574,8 @@ right_frame.pack(side="left", padx=5, pady=5, expand=True, fill="both")
 # Widgets for left frame (Search, Display, Crop Information)
 label1 = tk.Label(left_frame, text="State Name:")
 label1.grid(row=0, column=0, padx=5, pady=5)
-entry1 = tk.Entry(left_frame)
+entry1 = ttk.Combobox(left_frame)
+entry1.bind('<KeyRelease>', lambda event: update_suggestions(event, 'state'))
 entry1.grid(row=0, column=1, padx=5, pady=5)
 entry1_example = tk.Entry(left_frame)
 entry1_example.insert(0, "Eg: Tamil Nadu")
@@ -1001,7 +584,8 @@ entry1_example.grid(row=0, column=2, padx=5, pady=5)
 
 label2 = tk.Label(left_frame, text="District Name:")
 label2.grid(row=1, column=0, padx=5, pady=5)
-entry2 = tk.Entry(left_frame)
+entry2 = ttk.Combobox(left_frame)
+entry2.bind('<KeyRelease>', lambda event: update_suggestions(event, 'district'))
 entry2.grid(row=1, column=1, padx=5, pady=5)
 entry2_example = tk.Entry(left_frame)
 entry2_example.insert(0, "Eg: Theni")
@@ -1010,7 +594,8 @@ entry2_example.grid(row=1, column=2, padx=5, pady=5)
 
 label3 = tk.Label(left_frame, text="Season:")
 label3.grid(row=2, column=0, padx=5, pady=5)
-entry3 = tk.Entry(left_frame)
+entry3 = ttk.Combobox(left_frame)
+entry3.bind('<KeyRelease>', lambda event: update_suggestions(event, 'season'))
 entry3.grid(row=2, column=1, padx=5, pady=5)
 entry3_example = tk.Entry(left_frame)
 entry3_example.insert(0, "Eg: Kharif")
@@ -1034,7 +619,7 @@ season_info_textbox.insert(tk.END, season_info_text)
 season_info_textbox.config(state=tk.DISABLED)
 
 # Buttons for search and display
-search_button = tk.Button(left_frame, text="Search", command=lambda: show_results(df))
+search_button = tk.Button(left_frame, text="Search", command=show_results)
 search_button.grid(row=5, column=0, padx=5, pady=5)
 
 next_button = tk.Button(left_frame, text="Next", command=display_crop_info)
@@ -1047,7 +632,8 @@ result_textbox.grid(row=6, column=0, columnspan=2, padx=5, pady=5)
 # Entry for crop name
 crop_entry_label = tk.Label(left_frame, text="ENTER THE CROP NAME", font=("Helvetica", 14, "bold"))
 crop_entry_label.grid(row=7, column=0, columnspan=2, padx=5, pady=5)
-crop_entry = tk.Entry(left_frame)
+crop_entry = ttk.Combobox(left_frame)
+crop_entry.bind('<KeyRelease>', lambda event: update_suggestions(event, 'crop'))
 crop_entry.grid(row=8, column=0, columnspan=2, padx=5, pady=5)
 
 # Crop dropdown menu
@@ -1062,6 +648,12 @@ else:
 crop_menu = ttk.Combobox(left_frame, textvariable=crop_var, values=crop_options)
 crop_menu.grid(row=9, column=0, columnspan=2, padx=5, pady=5)
 
+# Dataset loading status
+status_label = tk.Label(left_frame, text="")
+status_label.grid(row=10, column=0, padx=5, pady=5)
+progress_bar = ttk.Progressbar(left_frame, mode='indeterminate', length=150)
+progress_bar.grid(row=10, column=1, padx=5, pady=5)
+
 # Widgets for right frame (Watering Reminder, Fertilizer Reminder)
 start_date_label = tk.Label(right_frame, text="Enter planting date (YYYY-MM-DD):")
 start_date_label.grid(row=0, column=0, columnspan=2, padx=5, pady=5)
@@ -1084,5 +676,22 @@ watering_button.grid(row=6, column=0, columnspan=2, padx=5, pady=5)
 fertilizer_button = tk.Button(right_frame, text="Check Fertilizer Reminder", command=check_fertilizer_reminder)
 fertilizer_button.grid(row=7, column=0, columnspan=2, padx=5, pady=5)
 
+roster_button = tk.Button(right_frame, text="Load Plot Roster", command=load_plot_roster_file)
+roster_button.grid(row=8, column=0, columnspan=2, padx=5, pady=5)
+
+# Record when the first frame has been drawn
+def record_first_window():
+    root.update_idletasks()
+    record_startup_time('first_window')
+
+root.after_idle(record_first_window)
+
+# Load today's reminders and send any that were missed while the app was closed
+root.after_idle(fire_due_reminders)
+
+# Load the dataset in the background so the window appears right away
+start_dataset_load(force=True)
+root.after(RELOAD_POLL_MS, watch_data_files)
+
 # Run the GUI main loop
 root.mainloop()
@@ -1,75 +1,506 @@
+import argparse
+import collections
+import itertools
+import json
+import threading
+import time
+
 import cv2
-import mediapipe as mp
-import pyautogui
+import numpy as np
+
+# Command-line options for the timing instrumentation and the offline replay mode
+parser = argparse.ArgumentParser(description="Control the mouse cursor with eye movements and blinks.")
+parser.add_argument("--overlay", action="store_true", help="draw FPS and per-stage p50/p95/p99 on the frame")
+parser.add_argument("--trace", help="write every stage timing to this .csv or .jsonl file")
+parser.add_argument("--stats-interval", type=float, default=0, help="print stage percentiles every N seconds")
+parser.add_argument("--replay", help="run headless on a recorded video, or on landmarks saved as .npz, as fast as possible")
+parser.add_argument("--events", help="in replay mode, write the cursor moves and clicks to this JSONL file")
+parser.add_argument("--screen", default="1920x1080", help="screen size used in replay mode")
+parser.add_argument("--save-landmarks", help="save the landmarks of every frame to this .npz file for replay")
+parser.add_argument("--no-roi", dest="roi", action="store_false", help="always run FaceMesh on the whole frame")
+parser.add_argument("--redetect-interval", type=int, default=30, help="frames between full-frame face detections")
+parser.add_argument("--target-fps", type=float, default=30,
+                    help="lower the FaceMesh input resolution until frames keep up with this rate (0 to disable)")
+parser.add_argument("--input-scale", type=float, default=1.0, help="fixed FaceMesh input scale used in replay mode")
+args = parser.parse_args()
+
+replaying = args.replay is not None
+landmark_replay = replaying and args.replay.lower().endswith('.npz')
+
+# Initialize face mesh with refined landmarks (not needed when replaying stored landmarks).
+# With ROI cropping one instance tracks the face crop and the other detects on the whole frame from scratch.
+if not landmark_replay:
+    import mediapipe as mp
+    face_mesh = mp.solutions.face_mesh.FaceMesh(refine_landmarks=True, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+    full_face_mesh = mp.solutions.face_mesh.FaceMesh(
+        static_image_mode=True, refine_landmarks=True, min_detection_confidence=0.5) if args.roi else face_mesh
+
+# Replays never touch the real mouse, so they run without a display
+if replaying:
+    screen_w, screen_h = (int(value) for value in args.screen.lower().split("x"))
+else:
+    import pyautogui
+    screen_w, screen_h = pyautogui.size()  # Get screen dimensions
+    # The actuation thread coalesces moves itself, so skip pyautogui's pause after every call
+    pyautogui.PAUSE = 0
 
-# Initialize face mesh with refined landmarks
-face_mesh = mp.solutions.face_mesh.FaceMesh(refine_landmarks=True, min_detection_confidence=0.5, min_tracking_confidence=0.5)
-screen_w, screen_h = pyautogui.size()  # Get screen dimensions
 speed_factor = 1.5  # Adjust to improve movement speed
 click_threshold = 0.006  # Adjust for blink detection sensitivity
-previous_mouse_x, previous_mouse_y = 0, 0  # Store previous mouse coordinates for smoothing
+previous_mouse = np.zeros(2, dtype=np.int64)  # Store previous mouse coordinates for smoothing
 smooth_factor = 0.5  # Factor for smoothing cursor movement
+click_cooldown = 1.0  # Seconds after a click during which blinks are ignored
+last_click_time = float('-inf')
+frame_buffer_size = 2  # Frames waiting for inference; older ones are dropped so latency stays bounded
+timing_window = 300  # Samples per stage kept for the rolling percentiles
+landmark_count = 478  # FaceMesh landmarks per face with refine_landmarks=True
+roi_margin = 0.3  # Extra space around the last face box, as a share of its size, so the face can move
+min_input_side = 192  # FaceMesh's own input size; downscaling below it only loses precision
+min_input_scale = 0.4  # Lowest input scale the FPS adaptation may choose
+cursor_index = 475  # Iris landmark that drives the cursor
+iris_indexes = slice(474, 478)  # Eye region landmarks drawn on the frame
+blink_indexes = [145, 159]  # Left-eye lower and upper lid landmarks used for blink detection
+
+# Landmarks of the current frame as (x, y, z) rows in whole-frame normalized coordinates;
+# filled in place every frame, so everything downstream works on views of this one array
+landmark_array = np.zeros((landmark_count, 3), dtype=np.float32)
+
+class FrameRing:
+    """Fixed-size frame buffer shared by the capture and inference stages.
+
+    A full buffer drops its oldest frame for live input; replays wait for space instead so no frame is skipped.
+    """
+
+    def __init__(self, size, drop_oldest=True):
+        self.frames = collections.deque(maxlen=size)
+        self.condition = threading.Condition()
+        self.drop_oldest = drop_oldest
+        self.dropped = 0
+
+    def put(self, item, timeout=0.1):
+        """Add (frame, frame id, capture timestamp, media time); returns False if a replay buffer stayed full."""
+        with self.condition:
+            if len(self.frames) == self.frames.maxlen:
+                if not self.drop_oldest:
+                    if not self.condition.wait_for(lambda: len(self.frames) < self.frames.maxlen, timeout):
+                        return False
+                else:
+                    self.dropped += 1
+            self.frames.append(item)
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout):
+        """Return the oldest item, or None if nothing arrives within timeout."""
+        with self.condition:
+            if not self.frames:
+                self.condition.wait(timeout)
+            if not self.frames:
+                return None
+            item = self.frames.popleft()
+            self.condition.notify_all()
+            return item
+
+class CursorCommands:
+    """Mailbox for the actuation thread: only the latest cursor position is kept, clicks are counted."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.position = None
+        self.clicks = 0
+
+    def move(self, x, y, frame_id, captured_at):
+        with self.condition:
+            self.position = (x, y, frame_id, captured_at)
+            self.condition.notify()
+
+    def click(self, frame_id):
+        with self.condition:
+            self.clicks += 1
+            self.condition.notify()
+
+    def take(self, timeout):
+        """Wait for work and return ((x, y, frame id, capture timestamp) or None, number of clicks)."""
+        with self.condition:
+            if self.position is None and not self.clicks:
+                self.condition.wait(timeout)
+            position, clicks = self.position, self.clicks
+            self.position, self.clicks = None, 0
+            return position, clicks
+
+class RecordingCursor:
+    """Replay stand-in for the mouse: records every move and click, in frame order, instead of performing it."""
+
+    def __init__(self, path=None):
+        self.file = open(path, 'w') if path else None
+        self.moves = 0
+        self.clicks = 0
+
+    def write(self, event):
+        if self.file is not None:
+            self.file.write(json.dumps(event) + "\n")
+
+    def move(self, x, y, frame_id, captured_at):
+        self.moves += 1
+        self.write({'frame': frame_id, 'event': 'move', 'x': x, 'y': y})
+
+    def click(self, frame_id):
+        self.clicks += 1
+        self.write({'frame': frame_id, 'event': 'click'})
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+class RoiTracker:
+    """Chooses what FaceMesh sees: a crop around the last face box, or the whole frame every
+    `redetect_interval` frames and whenever the face is lost. Inputs are downscaled by `scale`,
+    which adapts to the frame time when a target FPS is given."""
+
+    def __init__(self, use_roi, redetect_interval, target_fps, scale):
+        self.use_roi = use_roi
+        self.redetect_interval = redetect_interval
+        self.frame_budget = 1 / target_fps if target_fps else None
+        self.scale = scale
+        self.frame_cost = None  # Moving average of the processing time per frame
+        self.box = None  # Last face box in pixels: (x0, y0, x1, y1)
+        self.frames_since_full = 0
+
+    def region(self, frame_w, frame_h):
+        """Return the (x0, y0, x1, y1) region to process next, and whether it is a crop."""
+        if self.use_roi and self.box is not None and self.frames_since_full < self.redetect_interval:
+            self.frames_since_full += 1
+            return self.box, True
+        self.frames_since_full = 0
+        return (0, 0, frame_w, frame_h), False
+
+    def prepare(self, frame, region):
+        """Crop, downscale and convert a BGR frame region to the RGB image FaceMesh expects."""
+        x0, y0, x1, y1 = region
+        image = frame[y0:y1, x0:x1]
+        factor = max(self.scale, min_input_side / min(x1 - x0, y1 - y0))
+        if factor < 1:
+            image = cv2.resize(image, (round((x1 - x0) * factor), round((y1 - y0) * factor)), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def detect(self, frame, image, region, cropped):
+        """Run FaceMesh and return the landmarks in whole-frame normalized coordinates, or None.
+        A crop that lost the face is retried on the whole frame straight away."""
+        frame_h, frame_w = frame.shape[:2]
+        output = (face_mesh if cropped or not self.use_roi else full_face_mesh).process(image)
+        if not output.multi_face_landmarks:
+            self.box = None
+            if cropped:
+                full_region, _ = self.region(frame_w, frame_h)
+                return self.detect(frame, self.prepare(frame, full_region), full_region, False)
+            return None
+
+        # The MediaPipe landmark objects are read once, then mapped from the region to the whole frame in place
+        points = output.multi_face_landmarks[0].landmark
+        landmark_array.reshape(-1)[:] = np.fromiter(
+            itertools.chain.from_iterable((point.x, point.y, point.z) for point in points),
+            dtype=np.float32, count=landmark_count * 3
+        )
+        x0, y0, x1, y1 = region
+        landmark_array[:, :2] *= ((x1 - x0) / frame_w, (y1 - y0) / frame_h)
+        landmark_array[:, :2] += (x0 / frame_w, y0 / frame_h)
+        landmark_array[:, 2] *= (x1 - x0) / frame_w
+        self.box = self.face_box(landmark_array, frame_w, frame_h)
+        return landmark_array
+
+    def face_box(self, landmarks, frame_w, frame_h):
+        """Square box around the landmarks plus roi_margin, clipped to the frame."""
+        pixels = landmarks[:, :2] * (frame_w, frame_h)
+        low, high = pixels.min(axis=0), pixels.max(axis=0)
+        center = (low + high) / 2
+        half = (high - low).max() * (0.5 + roi_margin)
+        x0, y0 = (max(0, int(value)) for value in center - half)
+        x1, y1 = min(frame_w, int(center[0] + half)), min(frame_h, int(center[1] + half))
+        return (x0, y0, x1, y1) if x1 - x0 > 1 and y1 - y0 > 1 else None
+
+    def adapt(self, seconds):
+        """Lower the input scale when frames take longer than the budget, raise it again when there is slack."""
+        self.frame_cost = seconds if self.frame_cost is None else 0.9 * self.frame_cost + 0.1 * seconds
+        if self.frame_budget is None:
+            return
+        if self.frame_cost > self.frame_budget:
+            self.scale = max(min_input_scale, self.scale * 0.9)
+        elif self.frame_cost < 0.7 * self.frame_budget:
+            self.scale = min(1.0, self.scale * 1.05)
+
+class StageTimer:
+    """Rolling per-stage timings from time.monotonic(), shared by all threads, with an optional trace file."""
+
+    def __init__(self, window, trace_path=None):
+        self.samples = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        self.frame_times = collections.deque(maxlen=window)
+        self.lock = threading.Lock()
+        self.trace_file = None
+        self.trace_jsonl = False
+        if trace_path:
+            self.trace_file = open(trace_path, 'w')
+            self.trace_jsonl = trace_path.lower().endswith('.jsonl')
+            if not self.trace_jsonl:
+                self.trace_file.write("frame,stage,start,duration_ms\n")
+
+    def record(self, stage, start, end, frame_id=None):
+        with self.lock:
+            self.samples[stage].append(end - start)
+            if self.trace_file is not None:
+                duration_ms = round((end - start) * 1000, 3)
+                if self.trace_jsonl:
+                    self.trace_file.write(json.dumps(
+                        {'frame': frame_id, 'stage': stage, 'start': start, 'duration_ms': duration_ms}) + "\n")
+                else:
+                    self.trace_file.write(f"{'' if frame_id is None else frame_id},{stage},{start:.6f},{duration_ms}\n")
+
+    def lap(self, stage, start, frame_id=None):
+        """Record a stage that started at `start` and ends now; returns now so the next stage can start from it."""
+        end = time.monotonic()
+        self.record(stage, start, end, frame_id)
+        return end
 
-# Initialize camera capture
-icam = cv2.VideoCapture(0)
+    def frame_done(self, timestamp):
+        with self.lock:
+            self.frame_times.append(timestamp)
 
-def smooth_coordinates(new_x, new_y, prev_x, prev_y, smooth_factor):
-    """Smooth cursor movement using a weighted average."""
-    smoothed_x = int(prev_x * (1 - smooth_factor) + new_x * smooth_factor)
-    smoothed_y = int(prev_y * (1 - smooth_factor) + new_y * smooth_factor)
-    return smoothed_x, smoothed_y
+    def fps(self):
+        with self.lock:
+            if len(self.frame_times) < 2:
+                return 0.0
+            return (len(self.frame_times) - 1) / (self.frame_times[-1] - self.frame_times[0])
 
-while True:
-    _, frame = icam.read() 
+    def percentiles(self):
+        """Return {stage: (p50, p95, p99)} in milliseconds over the rolling window."""
+        with self.lock:
+            snapshot = {stage: sorted(values) for stage, values in self.samples.items() if values}
+        return {
+            stage: tuple(values[min(len(values) - 1, int(q * len(values)))] * 1000 for q in (0.50, 0.95, 0.99))
+            for stage, values in snapshot.items()
+        }
+
+    def summary_lines(self):
+        lines = [f"{self.fps():.1f} FPS"]
+        for stage, (p50, p95, p99) in self.percentiles().items():
+            lines.append(f"{stage}: p50 {p50:.1f} p95 {p95:.1f} p99 {p99:.1f} ms")
+        return lines
+
+    def close(self):
+        with self.lock:
+            if self.trace_file is not None:
+                self.trace_file.close()
+                self.trace_file = None
+
+# Initialize the frame source: the camera, or a recorded video when replaying one
+icam = None if landmark_replay else cv2.VideoCapture(args.replay if replaying else 0)
+
+frame_ring = FrameRing(frame_buffer_size, drop_oldest=not replaying)
+cursor_commands = RecordingCursor(args.events) if replaying else CursorCommands()
+# Replays keep every sample so their percentiles cover the whole run
+stage_timer = StageTimer(None if replaying else timing_window, args.trace)
+# Replays use a fixed input scale so their results don't depend on how fast the machine is
+roi_tracker = RoiTracker(args.roi, args.redetect_interval, 0 if replaying else args.target_fps,
+                         args.input_scale if replaying else 1.0)
+stop_event = threading.Event()
+capture_done = threading.Event()
+saved_landmarks, saved_times = [], []
+frame_size = None
+
+def capture_frames():
+    """Capture stage: read frames as fast as the camera (or the video decoder) delivers them."""
+    frame_id = 0
+    try:
+        while not stop_event.is_set():
+            start = time.monotonic()
+            ok, frame = icam.read()
+            if not ok:
+                break
+            captured_at = stage_timer.lap('capture', start, frame_id)
+            # Blink cooldowns follow the video's own clock in replays, so results don't depend on speed
+            frame_time = icam.get(cv2.CAP_PROP_POS_MSEC) / 1000 if replaying else captured_at
+            while not frame_ring.put((frame, frame_id, captured_at, frame_time)):
+                if stop_event.is_set():
+                    return
+            frame_id += 1
+    finally:
+        capture_done.set()
+
+def actuate_cursor():
+    """Actuation stage: apply the newest cursor position and any clicks without holding up tracking."""
+    while not stop_event.is_set():
+        position, clicks = cursor_commands.take(timeout=0.1)
+        if position is not None:
+            x, y, frame_id, captured_at = position
+            start = time.monotonic()
+            pyautogui.moveTo(x, y)  # Move the cursor
+            moved_at = stage_timer.lap('mouse', start, frame_id)
+            stage_timer.record('capture_to_cursor', captured_at, moved_at, frame_id)
+        for _ in range(clicks):
+            pyautogui.click()  # Perform a left mouse click
+
+def smooth_coordinates(new, prev, smooth_factor):
+    """Smooth cursor movement using a weighted average of (x, y) arrays."""
+    return (prev * (1 - smooth_factor) + new * smooth_factor).astype(np.int64)
+
+def draw_overlay(frame, lines):
+    """Draw the timing summary in the top-left corner of the frame."""
+    for i, line in enumerate(lines):
+        cv2.putText(frame, line, (10, 20 + 18 * i), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+
+def save_landmarks(landmarks, frame_time):
+    """Keep this frame's landmarks (NaN when no face was found) for --save-landmarks."""
+    if landmarks is None:
+        saved_landmarks.append(np.full((landmark_count, 3), np.nan, dtype=np.float32))
+    else:
+        saved_landmarks.append(landmarks.copy())
+    saved_times.append(frame_time)
+
+def track(landmarks, frame, frame_w, frame_h, frame_id, captured_at, frame_time):
+    """Move the cursor from the eye landmarks and click on a blink; draws the landmarks when there is a frame.
+    `landmarks` is an (N, 3) array of normalized coordinates."""
+    global previous_mouse, last_click_time
+
+    # Pixel coordinates of the eye region landmarks (truncated like int() did)
+    frame_scale = (frame_w, frame_h)
+    cursor_pixel = (landmarks[cursor_index, :2] * frame_scale).astype(np.int64)
+
+    # Control the mouse cursor with one of the eye landmarks, smoothing the movement
+    screen_position = cursor_pixel * (screen_w / frame_w * speed_factor, screen_h / frame_h * speed_factor)
+    smoothed = smooth_coordinates(screen_position, previous_mouse, smooth_factor)
+    cursor_commands.move(int(smoothed[0]), int(smoothed[1]), frame_id, captured_at)  # Hand the move to the actuation stage
+    previous_mouse = smoothed  # Update previous coordinates
+
+    if frame is not None:
+        for x, y in (landmarks[iris_indexes, :2] * frame_scale).astype(np.int64).tolist():
+            cv2.circle(frame, (x, y), 3, (0, 255, 0), -1)  # Draw a circle at each landmark
+        for x, y in (landmarks[blink_indexes, :2] * frame_scale).astype(np.int64).tolist():
+            cv2.circle(frame, (x, y), 3, (0, 255, 255), -1)  # Highlight left-eye landmarks
+
+    # Blink detection for left eye click; the cooldown replaces the old 1 s sleep so tracking never stops
+    eye_aspect_ratio = landmarks[blink_indexes[0], 1] - landmarks[blink_indexes[1], 1]  # Lid distance for blink detection
+    if eye_aspect_ratio < click_threshold and frame_time - last_click_time >= click_cooldown:  # Check if blink detected
+        cursor_commands.click(frame_id)
+        last_click_time = frame_time
+
+def process_frame(frame, frame_id, captured_at, frame_time):
+    """Inference stage for one camera or video frame; returns False when the user asked to quit."""
+    global frame_size
+    stage_start = stage_timer.lap('queue', captured_at, frame_id)  # Time spent waiting in the ring buffer
+    processing_start = stage_start
     frame = cv2.flip(frame, 1)  # Flip the frame horizontally
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # Process the frame using MediaPipe Face Mesh
-    output = face_mesh.process(rgb_frame)
-    landmark_points = output.multi_face_landmarks
-    
+    stage_start = stage_timer.lap('flip', stage_start, frame_id)
+
     # Get frame dimensions
     frame_h, frame_w, _ = frame.shape
+    frame_size = (frame_w, frame_h)
 
-    if landmark_points:
-        landmarks = landmark_points[0].landmark
-        
-        # Get coordinates for cursor control (e.g., use eye region landmarks)
-        for index, landmark in enumerate(landmarks[474:478]):
-            x = int(landmark.x * frame_w)
-            y = int(landmark.y * frame_h)
-            cv2.circle(frame, (x, y), 3, (0, 255, 0), -1)  # Draw a circle at each landmark
-            
-            # Control the mouse cursor with one of the eye landmarks
-            if index == 1:  # Using landmark 475 (second in this slice)
-                screen_x = screen_w / frame_w * x * speed_factor
-                screen_y = screen_h / frame_h * y * speed_factor
-                
-                # Smooth the cursor movement
-                smoothed_x, smoothed_y = smooth_coordinates(screen_x, screen_y, previous_mouse_x, previous_mouse_y, smooth_factor)
-                pyautogui.moveTo(smoothed_x, smoothed_y)  # Move the cursor
-                previous_mouse_x, previous_mouse_y = smoothed_x, smoothed_y  # Update previous coordinates
-
-        # Track specific left-eye landmarks for blink detection
-        left_eye_landmarks = [landmarks[145], landmarks[159]]  # Indices for left-eye landmarks
-        for landmark in left_eye_landmarks:
-            x = int(landmark.x * frame_w)
-            y = int(landmark.y * frame_h)
-            cv2.circle(frame, (x, y), 3, (0, 255, 255), -1)  # Highlight left-eye landmarks
+    # Only the face region is cropped, downscaled and converted for FaceMesh
+    region, cropped = roi_tracker.region(frame_w, frame_h)
+    image = roi_tracker.prepare(frame, region)
+    stage_start = stage_timer.lap('color', stage_start, frame_id)
+
+    # Process the frame using MediaPipe Face Mesh
+    landmarks = roi_tracker.detect(frame, image, region, cropped)
+    stage_start = stage_timer.lap('inference', stage_start, frame_id)
+
+    if landmarks is not None:
+        track(landmarks, frame, frame_w, frame_h, frame_id, captured_at, frame_time)
+    if args.save_landmarks:
+        save_landmarks(landmarks, frame_time)
+    stage_start = stage_timer.lap('drawing', stage_start, frame_id)
+    roi_tracker.adapt(stage_start - processing_start)
+
+    if replaying:
+        stage_timer.frame_done(stage_start)
+        stage_timer.record('end_to_end', captured_at, stage_start, frame_id)
+        return True
+
+    if args.overlay:
+        if roi_tracker.box is not None:
+            x0, y0, x1, y1 = roi_tracker.box
+            cv2.rectangle(frame, (x0, y0), (x1, y1), (255, 255, 0), 1)  # Region FaceMesh sees next
+        draw_overlay(frame, stage_timer.summary_lines() + [f"input scale {roi_tracker.scale:.2f}"])
 
-        # Blink detection for left eye click
-        eye_aspect_ratio = left_eye_landmarks[0].y - left_eye_landmarks[1].y  # Calculate eye aspect ratio for blink detection
-        if eye_aspect_ratio < click_threshold:  # Check if blink detected
-            pyautogui.click()  # Perform a left mouse click
-            pyautogui.sleep(1)  # Add a small delay to avoid multiple clicks
-    
     # Display the frame
     cv2.imshow('EYE CONTROLLED MOUSE', frame)
 
     # Break loop on 'q' key press
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+    key = cv2.waitKey(1) & 0xFF
+    displayed_at = stage_timer.lap('imshow', stage_start, frame_id)
+    stage_timer.record('capture_to_display', captured_at, displayed_at, frame_id)
+    stage_timer.frame_done(displayed_at)
+    return key != ord('q')
+
+def replay_landmarks(file_path):
+    """Run the tracking and blink stages on landmarks saved with --save-landmarks."""
+    stored = np.load(file_path)
+    frame_w, frame_h = (int(value) for value in stored['frame_size'])
+    # Each frame is passed to track as a view of the stored (frames, N, 3) array
+    stream = stored['landmarks']
+    for frame_id, (points, frame_time) in enumerate(zip(stream, stored['timestamps'])):
+        start = time.monotonic()
+        if not np.isnan(points[0, 0]):
+            track(points, None, frame_w, frame_h, frame_id, start, float(frame_time))
+        stage_timer.frame_done(stage_timer.lap('tracking', start, frame_id))
+    return len(stream)
+
+run_start = time.monotonic()
+last_stats_time = run_start
+frames = 0
+if landmark_replay:
+    frames = replay_landmarks(args.replay)
+else:
+    capture_thread = threading.Thread(target=capture_frames, daemon=True)
+    capture_thread.start()
+    if not replaying:
+        actuation_thread = threading.Thread(target=actuate_cursor, daemon=True)
+        actuation_thread.start()
+
+    # Inference stage: runs on the main thread because cv2.imshow has to
+    while True:
+        # Checked before waiting so a frame put just before the end of the stream isn't missed
+        finished = capture_done.is_set()
+        item = frame_ring.get(timeout=0.1)
+        if item is None:
+            if finished:
+                break
+            continue
+        frames += 1
+        if not process_frame(*item):
+            break
+
+        now = time.monotonic()
+        if args.stats_interval and now - last_stats_time >= args.stats_interval:
+            print(" | ".join(stage_timer.summary_lines()), flush=True)
+            last_stats_time = now
+
+    # Stop the capture and actuation threads, release the camera and close all windows
+    stop_event.set()
+    capture_thread.join()
+    if not replaying:
+        actuation_thread.join()
+    icam.release()
+    if not replaying:
+        cv2.destroyAllWindows()
+run_seconds = time.monotonic() - run_start
+stage_timer.close()
+
+if args.save_landmarks and frame_size is not None:
+    np.savez_compressed(args.save_landmarks, landmarks=np.stack(saved_landmarks),
+                        timestamps=np.array(saved_times), frame_size=np.array(frame_size))
 
-# Release the camera and close all windows
-icam.release()
-cv2.destroyAllWindows()
+if replaying:
+    # Machine-readable summary so runs of different versions can be compared
+    cursor_commands.close()
+    print(json.dumps({
+        'source': args.replay,
+        'frames': frames,
+        'seconds': round(run_seconds, 3),
+        'fps': round(frames / run_seconds, 1) if run_seconds else None,
+        'moves': cursor_commands.moves,
+        'clicks': cursor_commands.clicks,
+        'stages_ms': {stage: {'p50': round(p50, 3), 'p95': round(p95, 3), 'p99': round(p99, 3)}
+                      for stage, (p50, p95, p99) in stage_timer.percentiles().items()}
+    }))
+else:
+    print("\n".join(stage_timer.summary_lines()))
+    print(f"Frames dropped by the ring buffer: {frame_ring.dropped}")
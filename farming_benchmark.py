@@ -0,0 +1,309 @@
+# Benchmarks for the dataset load, search and reminder paths on synthetic crop production data.
+# Runs offline and without a display; each run is appended to a JSONL file tagged with the git commit.
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from farming_engine import (
+    build_crop_index, cache_dir_for, crop_actions, crop_data, due_fertilizer_actions, find_matching_rows,
+    import_data_libraries, load_csv, watering_reminders
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Shape of the synthetic dataset, close to the real crop_production file
+STATE_NAMES = [
+    "Andaman and Nicobar Islands", "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chandigarh",
+    "Chhattisgarh", "Dadra and Nagar Haveli", "Goa", "Gujarat", "Haryana", "Himachal Pradesh",
+    "Jammu and Kashmir ", "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur",
+    "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Puducherry", "Punjab", "Rajasthan", "Sikkim",
+    "Tamil Nadu", "Telangana ", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal"
+]
+DISTRICTS_PER_STATE = 20
+# The real file pads seasons with trailing spaces
+SEASONS = ["Kharif     ", "Rabi       ", "Whole Year ", "Autumn     ", "Summer     ", "Winter     "]
+CROP_COUNT = 124
+CROPS_PER_DISTRICT = 30
+FIRST_YEAR, LAST_YEAR = 1997, 2015
+MISSING_PRODUCTION_SHARE = 0.015
+DISTRICT_SYLLABLES = ["ka", "ra", "pur", "na", "thi", "ma", "du", "gan", "vel", "lo", "sa", "bad", "che", "ni"]
+
+# Function to make `count` distinct, pronounceable district names
+def synthetic_district_names(rng, count):
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choice(DISTRICT_SYLLABLES, size=rng.integers(2, 5))).upper())
+    return sorted(names)
+
+# Function to write a synthetic crop production CSV with `rows` rows, in chunks so 10M rows fit in memory
+def generate_crop_production(rows, file_path, seed=0, chunk_rows=1000000):
+    rng = np.random.default_rng(seed)
+    districts = np.array(synthetic_district_names(rng, len(STATE_NAMES) * DISTRICTS_PER_STATE))
+    district_states = np.repeat(np.array(STATE_NAMES), DISTRICTS_PER_STATE)
+    known_crops = list(crop_actions) + [name for name in crop_data if name not in crop_actions]
+    crops = np.array(known_crops + [f"Crop {i}" for i in range(CROP_COUNT - len(known_crops))])
+    seasons = np.array(SEASONS)
+
+    written = 0
+    with open(file_path, 'w', newline='') as f:
+        while written < rows:
+            n = min(chunk_rows, rows - written)
+            district = rng.integers(0, len(districts), n)
+            # Each district grows its own subset of crops, like real districts do
+            crop = (district * 7 + rng.integers(0, CROPS_PER_DISTRICT, n)) % len(crops)
+            area = rng.lognormal(6, 1.5, n).round()
+            production = (area * rng.lognormal(0.5, 0.8, n)).round(2)
+            production[rng.random(n) < MISSING_PRODUCTION_SHARE] = np.nan
+            pd.DataFrame({
+                'State_Name': district_states[district],
+                'District_Name': districts[district],
+                'Crop_Year': rng.integers(FIRST_YEAR, LAST_YEAR, n),
+                'Season': seasons[rng.integers(0, len(seasons), n)],
+                'Crop': crops[crop],
+                'Area': area,
+                'Production': production
+            }).to_csv(f, header=written == 0, index=False)
+            written += n
+
+# Function to build a query mix like the GUI sees: mostly hits typed in varying case and spacing,
+# some valid places with a season they don't grow in, and a few misspelled districts
+def query_mix(df, count, seed=0):
+    rng = random.Random(seed)
+    keys = list(df[['State_Name', 'District_Name', 'Season']].drop_duplicates().itertuples(index=False))
+    seasons = [season.strip() for season in SEASONS]
+    queries = []
+    for _ in range(count):
+        state, district, season = rng.choice(keys)
+        state, district, season = state.strip(), district.strip(), season.strip()
+        roll = rng.random()
+        if roll < 0.6:
+            queries.append((state, district.title(), season))
+        elif roll < 0.8:
+            queries.append((f" {state.upper()}", f"{district.lower()} ", season.lower()))
+        elif roll < 0.95:
+            queries.append((state, district, rng.choice(seasons)))
+        else:
+            queries.append((state, district[:-1] + "X", season))
+    return queries
+
+# Function to call func and return its result and the elapsed seconds
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+# Function to measure the peak Python/NumPy allocation of a call, in MB
+def peak_memory_mb(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+    finally:
+        tracemalloc.stop()
+
+# Function to summarize per-call latencies given in nanoseconds
+def latency_summary(samples_ns):
+    samples = sorted(samples_ns)
+    def percentile(fraction):
+        return round(samples[min(len(samples) - 1, int(fraction * len(samples)))] / 1000, 1)
+    return {
+        'calls': len(samples),
+        'seconds': round(sum(samples) / 1e9, 4),
+        'p50_us': percentile(0.50),
+        'p95_us': percentile(0.95),
+        'p99_us': percentile(0.99)
+    }
+
+# Function to time find_matching_rows for each query; returns the summary and the number of hits
+def time_queries(df, queries, index):
+    if not queries:
+        return {}
+    samples = []
+    hits = 0
+    for query in queries:
+        start = time.perf_counter_ns()
+        crops = find_matching_rows(df, query, index)
+        samples.append(time.perf_counter_ns() - start)
+        hits += not crops.empty
+    summary = latency_summary(samples)
+    summary['hit_rate'] = round(hits / len(queries), 3)
+    return summary
+
+# Function to build random plots as (plot_id, crop, planting_date, watering interval)
+def synthetic_plots(count, today, seed=0):
+    rng = random.Random(seed)
+    crops = [
+        crop for crop, info in crop_data.items()
+        if isinstance(info['Watering Schedule']['Number of Days'], int) and crop in crop_actions
+    ]
+    plots = []
+    for plot_id in range(count):
+        crop = rng.choice(crops)
+        planting_date = today - datetime.timedelta(days=rng.randrange(0, 120))
+        plots.append((plot_id, crop, planting_date, crop_data[crop]['Watering Schedule']['Number of Days']))
+    return plots
+
+# Function to time the date generation behind "Set Watering Reminder", one plot per call
+def time_watering_reminders(plots, today):
+    samples = []
+    for _, crop, planting_date, interval in plots:
+        start = time.perf_counter_ns()
+        watering_reminders(crop, planting_date, planting_date + datetime.timedelta(days=120), interval, today)
+        samples.append(time.perf_counter_ns() - start)
+    return latency_summary(samples)
+
+# Function to time the lookups behind "Check Fertilizer Reminder": one call per plot, then one for all plots
+def time_fertilizer_checks(plots, today):
+    since = today - datetime.timedelta(days=7)
+    samples = []
+    for plot_id, crop, planting_date, _ in plots:
+        start = time.perf_counter_ns()
+        due_fertilizer_actions([(plot_id, crop, planting_date)], since, today)
+        samples.append(time.perf_counter_ns() - start)
+    summary = latency_summary(samples)
+    _, summary['all_plots_seconds'] = timed(
+        due_fertilizer_actions, [plot[:3] for plot in plots], since, today
+    )
+    summary['all_plots_seconds'] = round(summary['all_plots_seconds'], 4)
+    return summary
+
+# Function to run every benchmark against one CSV file
+def run_benchmarks(file_path, args):
+    import_data_libraries()
+    results = {}
+    shutil.rmtree(cache_dir_for(file_path), ignore_errors=True)
+
+    df, seconds = timed(load_csv, file_path, False)
+    results['load_csv_cold'] = {'seconds': round(seconds, 4)}
+    _, seconds = timed(load_csv, file_path)
+    results['load_csv_write_cache'] = {'seconds': round(seconds, 4)}
+    df, seconds = timed(load_csv, file_path)
+    results['load_csv_cached'] = {'seconds': round(seconds, 4)}
+    index, seconds = timed(build_crop_index, df)
+    results['build_crop_index'] = {'seconds': round(seconds, 4), 'keys': len(index)}
+    if args.memory:
+        results['load_csv_cold']['peak_mb'] = peak_memory_mb(load_csv, file_path, False)
+        results['load_csv_cached']['peak_mb'] = peak_memory_mb(load_csv, file_path)
+        results['build_crop_index']['peak_mb'] = peak_memory_mb(build_crop_index, df)
+
+    queries = query_mix(df, args.queries, args.seed)
+    results['find_matching_rows_indexed'] = time_queries(df, queries, index)
+    results['find_matching_rows_scan'] = time_queries(df, queries[:args.scan_queries], None)
+
+    today = datetime.date.today()
+    plots = synthetic_plots(args.plots, today, args.seed)
+    results['watering_reminders'] = time_watering_reminders(plots, today)
+    results['fertilizer_check'] = time_fertilizer_checks(plots, today)
+    return results
+
+# Function to get the current commit, and whether tracked files have uncommitted changes
+def git_revision():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+# Function to read the records already in the results file
+def load_records(file_path):
+    try:
+        with open(file_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+# Function to compare a record with the latest one for the same row count from another commit;
+# prints each metric's change and returns True if any got slower or bigger by more than `threshold`
+def report_regressions(record, records, threshold):
+    previous = [
+        old for old in records
+        if old['rows'] == record['rows'] and (old['commit'] != record['commit'] or old['dirty'] != record['dirty'])
+    ]
+    if not previous:
+        print(f"No earlier results for {record['rows']} rows to compare with.", file=sys.stderr)
+        return False
+
+    baseline = previous[-1]
+    regressed = False
+    for stage, metrics in record['results'].items():
+        for metric in ('seconds', 'p50_us', 'p95_us', 'peak_mb'):
+            old = baseline['results'].get(stage, {}).get(metric)
+            new = metrics.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            flag = "  REGRESSION" if ratio > threshold else ""
+            regressed = regressed or bool(flag)
+            print(f"{record['rows']} rows {stage}.{metric}: {old} -> {new} ({ratio:.2f}x){flag}", file=sys.stderr)
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dataset loading, searches and reminder generation.")
+    parser.add_argument("--rows", default="10000,100000,1000000",
+                        help="comma-separated synthetic dataset sizes (up to 10000000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "farming_benchmark"),
+                        help="where generated datasets are kept between runs")
+    parser.add_argument("--queries", type=int, default=2000, help="indexed searches per dataset")
+    parser.add_argument("--scan-queries", type=int, default=20, help="searches without the index per dataset")
+    parser.add_argument("--plots", type=int, default=1000, help="plots for the reminder benchmarks")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the peak memory runs")
+    parser.add_argument("--results", default=os.path.join(SCRIPT_DIR, "benchmark_results.jsonl"),
+                        help="JSONL file each run is appended to")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare with the previous commit's results and exit 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    commit, dirty = git_revision()
+    records = load_records(args.results)
+    regressed = False
+    for rows in (int(value) for value in args.rows.split(",")):
+        file_path = os.path.join(args.data_dir, f"crop_production_{rows}_{args.seed}.csv")
+        if not os.path.exists(file_path):
+            _, seconds = timed(generate_crop_production, rows, file_path, args.seed)
+            print(f"Generated {rows} rows in {seconds:.1f}s: {file_path}", file=sys.stderr)
+
+        # The engine reports progress on stdout; keep stdout for the JSON results
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_benchmarks(file_path, args)
+        record = {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'rows': rows,
+            'seed': args.seed,
+            'results': results
+        }
+        print(json.dumps(record), flush=True)
+        with open(args.results, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+        if args.compare:
+            regressed = report_regressions(record, records, args.threshold) or regressed
+
+    sys.exit(1 if regressed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,897 @@
+# Crop search, scheduling and crop knowledge shared by the GUI and the HTTP server
+import array
+import bisect
+import collections
+import collections.abc
+import datetime
+import functools
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import time
+
+# pandas/numpy are imported on first use (see import_data_libraries)
+pd = None
+np = None
+
+# Path to the crop production dataset
+CSV_PATH = r"D:\MINIPROJECT CSV\crop_production.csv.csv"
+
+# Bump when the cache layout changes so old caches are rebuilt
+CACHE_VERSION = 1
+
+# Files larger than this are loaded in chunks with only the search columns kept
+STREAM_THRESHOLD_BYTES = 512 * 1024 * 1024
+STREAM_CHUNK_ROWS = 200000
+STREAM_COLUMNS = ['State_Name', 'District_Name', 'Season', 'Crop']
+
+# Number of trigram candidates checked by edit distance for each fuzzy suggestion
+FUZZY_CANDIDATES = 50
+
+# Versioned crop knowledge base (crop facts and fertilizer schedules)
+KNOWLEDGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crop_knowledge.json")
+KNOWLEDGE_VERSION = 1
+
+# Columns used for the yield ranking
+YIELD_COLUMNS = ['Crop_Year', 'Area', 'Production']
+
+# Function to import the data libraries the first time they are needed
+def import_data_libraries():
+    global pd, np
+    if pd is None:
+        import numpy as np
+        import pandas as pd
+
+# Function to get the cache directory that sits next to a CSV file
+def cache_dir_for(file_path):
+    return file_path + ".cache"
+
+# Function to hash the contents of a file
+def file_digest(file_path):
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Function to tell whether a column holds text (object dtype, or the str dtype pandas 3 uses by default)
+def is_text_dtype(dtype):
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+# Function to write a columnar cache of the dataset (category codes + dictionaries)
+def write_csv_cache(df, file_path):
+    cache_dir = cache_dir_for(file_path)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Remove the old metadata first so a half-written cache is never used
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        stat = os.stat(file_path)
+        meta = {
+            'version': CACHE_VERSION,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': file_digest(file_path),
+            'columns': []
+        }
+        for i, column in enumerate(df.columns):
+            series = df[column]
+            entry = {'name': column}
+            if is_text_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype):
+                categorical = pd.Categorical(series)
+                entry['categories'] = categorical.categories.tolist()
+                values = categorical.codes
+            else:
+                values = series.to_numpy()
+            # Object arrays are pickled by np.save and cannot be memory-mapped, so give up on the cache instead
+            if values.dtype == object:
+                raise TypeError(f"column {column!r} has no fixed-size dtype")
+            np.save(os.path.join(cache_dir, f"col{i}.npy"), values)
+            meta['columns'].append(entry)
+
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+    except (OSError, TypeError, ValueError) as e:
+        print("Could not write cache:", e)
+
+# Function to load the dataset from its cache, or None if the cache is missing or stale
+def load_csv_cache(file_path):
+    cache_dir = cache_dir_for(file_path)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        stat = os.stat(file_path)
+        if meta['version'] != CACHE_VERSION or meta['size'] != stat.st_size:
+            return None
+        if meta['mtime_ns'] != stat.st_mtime_ns:
+            # Same size but touched or copied: only trust the cache if the content is unchanged
+            if meta['sha1'] != file_digest(file_path):
+                return None
+            meta['mtime_ns'] = stat.st_mtime_ns
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+
+        # The columns stay memory-mapped: codes and numbers are read from the cache files on demand, not copied
+        columns = {}
+        for i, entry in enumerate(meta['columns']):
+            values = np.load(os.path.join(cache_dir, f"col{i}.npy"), mmap_mode='r')
+            if 'categories' in entry:
+                dtype = pd.CategoricalDtype(entry['categories'])
+                columns[entry['name']] = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+            else:
+                columns[entry['name']] = values
+        return pd.DataFrame(columns, copy=False)
+    except (OSError, ValueError, KeyError):
+        return None
+
+# Function to store repeated text as categories and shrink numeric columns
+def compact_crop_table(df):
+    before = df.memory_usage(deep=True).sum()
+    for column in df.columns:
+        series = df[column]
+        if is_text_dtype(series.dtype):
+            # Only worth it when values repeat, which is the case for names and seasons
+            if series.nunique() < len(series) // 2:
+                df[column] = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='float')
+    after = df.memory_usage(deep=True).sum()
+    print(f"Crop table memory: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB "
+          f"(saved {(before - after) / 1e6:.1f} MB)")
+    return df
+
+# Function to load CSV file
+def load_csv(file_path, use_cache=True):
+    if use_cache:
+        df = load_csv_cache(file_path)
+        if df is not None:
+            return df
+
+    try:
+        df = pd.read_csv(file_path)
+    except FileNotFoundError:
+        print("File not found.")
+        return None
+    except Exception as e:
+        print("Error occurred:", e)
+        return None
+
+    df = compact_crop_table(df)
+    if use_cache:
+        write_csv_cache(df, file_path)
+    return df
+
+# Function to normalize a search value the same way for the index and user input
+def normalize_key(value):
+    return value.strip().lower()
+
+# Function to add the rows of a (partial) dataset to a (state, district, season) -> crops index
+def update_crop_index(index, df):
+    # Normalize the key columns once, then keep one row per (key, crop) pair
+    keys = pd.DataFrame({
+        'state': df['State_Name'].str.strip().str.lower(),
+        'district': df['District_Name'].str.strip().str.lower(),
+        'season': df['Season'].str.strip().str.lower(),
+        'crop': df['Crop']
+    }).drop_duplicates()
+
+    # Crops are kept in an insertion-ordered dict so repeated chunks don't add duplicates
+    for state, district, season, crop in keys.itertuples(index=False):
+        index.setdefault((state, district, season), {})[crop] = None
+
+# Function to turn an index built by update_crop_index into its final lookup form
+def finalize_crop_index(index):
+    return {key: tuple(crops) for key, crops in index.items()}
+
+# Function to build a (state, district, season) -> crops index from the dataset
+def build_crop_index(df):
+    if df is None:
+        return {}
+    index = {}
+    update_crop_index(index, df)
+    return finalize_crop_index(index)
+
+# Function to concatenate frames of categorical columns without falling back to object dtype
+def concat_categorical(frames):
+    return pd.DataFrame({
+        column: pd.api.types.union_categoricals([frame[column] for frame in frames])
+        for column in frames[0].columns
+    })
+
+# Function to load a large CSV in chunks, keeping only the distinct search columns
+# plus yearly area/production totals for the yield ranking
+def load_csv_streaming(file_path, chunksize=STREAM_CHUNK_ROWS):
+    index = {}
+    table = None
+    totals = None
+    try:
+        reader = pd.read_csv(
+            file_path, usecols=lambda column: column in STREAM_COLUMNS + YIELD_COLUMNS,
+            dtype={column: 'category' for column in STREAM_COLUMNS}, chunksize=chunksize
+        )
+        for chunk in reader:
+            update_crop_index(index, chunk)
+            partial = yearly_yield_totals(chunk)
+            if partial is not None:
+                totals = partial if totals is None else combine_yield_totals([totals, partial])
+            chunk = chunk[STREAM_COLUMNS].drop_duplicates()
+            if table is None:
+                table = chunk
+            else:
+                table = concat_categorical([table, chunk]).drop_duplicates()
+    except FileNotFoundError:
+        print("File not found.")
+        return None, {}, None
+    except Exception as e:
+        print("Error occurred:", e)
+        return None, {}, None
+
+    if table is not None:
+        table = table.reset_index(drop=True)
+    return table, finalize_crop_index(index), totals
+
+# Function to total area and production per (state, district, season, crop, year), or None without those columns
+def yearly_yield_totals(df):
+    if df is None or not set(STREAM_COLUMNS + YIELD_COLUMNS) <= set(df.columns):
+        return None
+    frame = pd.DataFrame({
+        'state': df['State_Name'].str.strip().str.lower(),
+        'district': df['District_Name'].str.strip().str.lower(),
+        'season': df['Season'].str.strip().str.lower(),
+        'crop': df['Crop'].astype(str),
+        'year': pd.to_numeric(df['Crop_Year'], errors='coerce'),
+        'area': pd.to_numeric(df['Area'], errors='coerce').astype('float64'),
+        'production': pd.to_numeric(df['Production'], errors='coerce').astype('float64')
+    }).dropna()
+    return frame.groupby(['state', 'district', 'season', 'crop', 'year'], sort=False)[['area', 'production']].sum()
+
+# Function to merge partial totals from yearly_yield_totals
+def combine_yield_totals(parts):
+    return pd.concat(parts).groupby(level=[0, 1, 2, 3, 4], sort=False).sum()
+
+# Function to compute mean yield, yearly trend (least-squares slope) and variance per
+# (state, district, season, crop), best mean yield first within each key
+def build_yield_table(totals):
+    yearly = totals[totals['area'] > 0].reset_index()
+    yearly['yield'] = yearly['production'] / yearly['area']
+    yearly['x'] = yearly['year'].astype('float64')
+    yearly['xx'] = yearly['x'] * yearly['x']
+    yearly['xy'] = yearly['x'] * yearly['yield']
+    yearly['yy'] = yearly['yield'] * yearly['yield']
+
+    grouped = yearly.groupby(['state', 'district', 'season', 'crop'], sort=False)
+    sums = grouped[['x', 'yield', 'xx', 'xy', 'yy']].sum()
+    n = grouped.size()
+    mean = sums['yield'] / n
+    denominator = n * sums['xx'] - sums['x'] ** 2
+    table = pd.DataFrame({
+        'mean_yield': mean,
+        'trend': (n * sums['xy'] - sums['x'] * sums['yield']) / denominator.where(denominator != 0),
+        'variance': (sums['yy'] / n - mean ** 2).clip(lower=0),
+        'years': n
+    }).reset_index()
+    return table.sort_values(['state', 'district', 'season', 'mean_yield'], ascending=[True, True, True, False])
+
+# Function to group yield rows (state, district, season, crop, mean_yield, trend, variance, years) by search key
+def build_yield_index(rows):
+    index = {}
+    for state, district, season, crop, mean_yield, trend, variance, years in rows:
+        index.setdefault((state, district, season), []).append((crop, mean_yield, trend, variance, int(years)))
+    return {key: tuple(crops) for key, crops in index.items()}
+
+# Function to write the yield rows next to the dataset cache
+def write_yield_cache(rows, file_path):
+    cache_dir = cache_dir_for(file_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        stat = os.stat(file_path)
+        tmp_path = os.path.join(cache_dir, "yield.json.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                       'rows': rows}, f, default=float)
+        os.replace(tmp_path, os.path.join(cache_dir, "yield.json"))
+    except (OSError, TypeError, ValueError) as e:
+        print("Could not write cache:", e)
+
+# Function to read the cached yield rows, or None if they are missing or stale
+def load_yield_cache(file_path):
+    try:
+        with open(os.path.join(cache_dir_for(file_path), "yield.json")) as f:
+            cached = json.load(f)
+        stat = os.stat(file_path)
+        if (cached['version'], cached['mtime_ns'], cached['size']) != (CACHE_VERSION, stat.st_mtime_ns, stat.st_size):
+            return None
+        return cached['rows']
+    except (OSError, ValueError, KeyError):
+        return None
+
+# Function to get the yield ranking index, from the cache or by aggregating the dataset once
+def load_yield_index(file_path, df=None, totals=None):
+    rows = load_yield_cache(file_path)
+    if rows is None:
+        if totals is None:
+            totals = yearly_yield_totals(df)
+        if totals is None:
+            return {}
+        rows = list(build_yield_table(totals).itertuples(index=False, name=None))
+        write_yield_cache(rows, file_path)
+    return build_yield_index(rows)
+
+# Function to get the best `top` crops by mean yield for a (state, district, season)
+def ranked_crops(yield_index, state, district, season, top=None):
+    ranked = yield_index.get((normalize_key(state), normalize_key(district), normalize_key(season)), ())
+    return ranked if top is None else ranked[:top]
+
+# Function to build the search results of every (state, district, season) in one grouped pass.
+# Keys are normalized like find_matching_rows and crops are ordered like the GUI shows them:
+# best mean yield first, then crops without yield figures in dataset order.
+def district_season_report(df, yield_index=None):
+    # Deduplicate on the raw (categorical) columns first so the string work runs on few rows
+    table = df[STREAM_COLUMNS].drop_duplicates()
+    table = pd.DataFrame({
+        'state': table['State_Name'].str.strip().str.lower(),
+        'district': table['District_Name'].str.strip().str.lower(),
+        'season': table['Season'].str.strip().str.lower(),
+        'crop': table['Crop'].astype(str),
+        'State_Name': table['State_Name'].astype(str).str.strip(),
+        'District_Name': table['District_Name'].astype(str).str.strip(),
+        'Season': table['Season'].astype(str).str.strip()
+    }).drop_duplicates(['state', 'district', 'season', 'crop'])
+
+    ranks = pd.DataFrame(
+        [(*key, crop, rank, mean_yield)
+         for key, crops in (yield_index or {}).items()
+         for rank, (crop, mean_yield, *_) in enumerate(crops)],
+        columns=['state', 'district', 'season', 'crop', 'rank', 'mean_yield']
+    )
+    table = table.merge(ranks, on=['state', 'district', 'season', 'crop'], how='left')
+    table = table.sort_values(['state', 'district', 'season', 'rank'], kind='stable', na_position='last')
+
+    report = table.groupby(['state', 'district', 'season'], sort=False).agg(
+        State_Name=('State_Name', 'first'),
+        District_Name=('District_Name', 'first'),
+        Season=('Season', 'first'),
+        Crops=('crop', list),
+        Top_Crop=('crop', 'first'),
+        Top_Mean_Yield=('mean_yield', 'first')
+    ).reset_index(drop=True)
+    report.insert(4, 'Crop_Count', report['Crops'].str.len())
+    return report
+
+# Function to get a (mtime, size) signature of the dataset file
+def file_signature(file_path):
+    try:
+        stat = os.stat(file_path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+# Function to load the dataset and build its search index and yield ranking
+def load_dataset(file_path, signature):
+    import_data_libraries()
+    # Files too big to hold in memory are streamed and reduced to the search columns
+    if signature is not None and signature[1] > STREAM_THRESHOLD_BYTES:
+        table, index, totals = load_csv_streaming(file_path)
+        return table, index, load_yield_index(file_path, totals=totals) if table is not None else {}
+    loaded_df = load_csv(file_path)
+    if loaded_df is None:
+        return None, {}, {}
+    return loaded_df, build_crop_index(loaded_df), load_yield_index(file_path, df=loaded_df)
+
+# Function to look up the crops grown for a (state, district, season) in the index
+def find_crops(index, state, district, season):
+    return index.get((normalize_key(state), normalize_key(district), normalize_key(season)), ())
+
+# Function to encode an index key as bytes whose sort order is used by the shared index file
+def encode_index_key(key):
+    return "\x1f".join(key).encode()
+
+# Function to pack strings into one byte blob plus the offset where each one starts
+def pack_strings(values):
+    blob = bytearray()
+    offsets = array.array('I', [0])
+    for value in values:
+        blob += value
+        offsets.append(len(blob))
+    return bytes(blob), offsets
+
+# Function to write a (state, district, season) -> crops index to a flat file that processes can mmap.
+# With `fields`, each entry is (crop, *numbers) and its `fields` numbers are stored as doubles.
+# Layout: 6 uint32 counts, entry numbers, key offsets, per-key entry ranges, crop ids, crop name offsets,
+# key bytes, crop bytes.
+def write_shared_index(index, file_path, fields=0):
+    encoded = sorted((encode_index_key(key), key) for key in index)
+    crop_ids = array.array('I')
+    crop_ranges = array.array('I', [0])
+    numbers = array.array('d')
+    crop_names = {}
+    for _, key in encoded:
+        for entry in index[key]:
+            crop = entry[0] if fields else entry
+            crop_ids.append(crop_names.setdefault(str(crop), len(crop_names)))
+            if fields:
+                numbers.extend(float(number) for number in entry[1:])
+        crop_ranges.append(len(crop_ids))
+
+    key_blob, key_offsets = pack_strings(encoded_key for encoded_key, _ in encoded)
+    crop_blob, crop_offsets = pack_strings(name.encode() for name in crop_names)
+    # The header is 24 bytes, so the doubles that follow it stay 8-byte aligned
+    header = array.array('I', [len(encoded), len(crop_names), len(crop_ids), fields, len(key_blob), len(crop_blob)])
+    with open(file_path, 'wb') as f:
+        for part in (header, numbers, key_offsets, crop_ranges, crop_ids, crop_offsets):
+            part.tofile(f)
+        f.write(key_blob)
+        f.write(crop_blob)
+
+# Read-only index written by write_shared_index. The file is memory-mapped, so every process
+# that opens it shares one copy of the pages; it supports the same get()/len() as the dict index.
+class SharedCropIndex:
+    def __init__(self, file_path):
+        with open(file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        n_keys, n_crops, n_entries, fields, key_bytes, crop_bytes = view[:24].cast('I')
+        position = 24
+
+        def take(count, code='I'):
+            nonlocal position
+            size = 8 if code == 'd' else 4
+            part = view[position:position + size * count].cast(code)
+            position += size * count
+            return part
+
+        self._n_keys = n_keys
+        self._fields = fields
+        self._numbers = take(n_entries * fields, 'd')
+        self._key_offsets = take(n_keys + 1)
+        self._crop_ranges = take(n_keys + 1)
+        self._crop_ids = take(n_entries)
+        self._crop_offsets = take(n_crops + 1)
+        self._key_blob = view[position:position + key_bytes]
+        self._crop_blob = view[position + key_bytes:position + key_bytes + crop_bytes]
+
+    def __len__(self):
+        return self._n_keys
+
+    def _key(self, i):
+        return self._key_blob[self._key_offsets[i]:self._key_offsets[i + 1]].tobytes()
+
+    def _crop(self, i):
+        return self._crop_blob[self._crop_offsets[i]:self._crop_offsets[i + 1]].tobytes().decode()
+
+    # Function to build the entry at position `i`: the crop name, or (crop, *numbers) when the file has fields
+    def _entry(self, i):
+        crop = self._crop(self._crop_ids[i])
+        if not self._fields:
+            return crop
+        return (crop, *self._numbers[i * self._fields:(i + 1) * self._fields])
+
+    def get(self, key, default=None):
+        # Binary search over the sorted keys
+        target = encode_index_key(key)
+        low, high = 0, self._n_keys
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._n_keys or self._key(low) != target:
+            return default
+        return tuple(self._entry(i) for i in range(self._crop_ranges[low], self._crop_ranges[low + 1]))
+
+# Numbers stored for each entry of a shared yield index: mean_yield, trend, variance, years
+YIELD_FIELDS = 4
+
+# Yield ranking index written by write_shared_index(yield_index, path, YIELD_FIELDS);
+# entries are (crop, mean_yield, trend, variance, years) like build_yield_index's.
+class SharedYieldIndex(SharedCropIndex):
+    def _entry(self, i):
+        crop, mean_yield, trend, variance, years = super()._entry(i)
+        return crop, mean_yield, trend, variance, int(years)
+
+# Bounded least-recently-used cache with an optional time-to-live, counting hits, misses and evictions
+class LRUCache:
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, compute):
+        entry = self._entries.get(key)
+        if entry is not None and (self.ttl is None or time.monotonic() - entry[1] < self.ttl):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None
+        }
+
+# Function to reduce a name to lowercase letters and digits, so "Tamilnadu" matches "Tamil Nadu"
+def compact_key(value):
+    return "".join(ch for ch in value.lower() if ch.isalnum())
+
+# Function to split a compact key into padded character trigrams
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# Function to compute the edit distance between two strings, giving up once it exceeds `limit`
+def bounded_edit_distance(a, b, limit):
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ch_a in enumerate(a, 1):
+        current = [i]
+        for j, ch_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ch_a != ch_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+# Autocomplete over a set of names: prefix matches from a sorted array, then typo-tolerant
+# matches found through shared trigrams and checked with a bounded edit distance
+class SuggestionIndex:
+    def __init__(self, values):
+        entries = {}
+        for value in values:
+            if isinstance(value, str) and compact_key(value):
+                entries.setdefault(compact_key(value), value.strip())
+        self._keys = sorted(entries)
+        self._values = [entries[key] for key in self._keys]
+        self._grams = {}
+        for i, key in enumerate(self._keys):
+            for gram in trigrams(key):
+                self._grams.setdefault(gram, []).append(i)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def suggest(self, text, limit=5, max_distance=2):
+        key = compact_key(text)
+        if not key:
+            return []
+
+        results = []
+        i = bisect.bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i].startswith(key) and len(results) < limit:
+            results.append(self._values[i])
+            i += 1
+        if len(results) >= limit:
+            return results
+
+        # Rank the names sharing the most trigrams, then keep those within max_distance edits
+        shared = collections.Counter()
+        for gram in trigrams(key):
+            shared.update(self._grams.get(gram, ()))
+        close = []
+        for i, _ in shared.most_common(FUZZY_CANDIDATES):
+            distance = bounded_edit_distance(key, self._keys[i], max_distance)
+            if distance <= max_distance and self._values[i] not in results:
+                close.append((distance, self._values[i]))
+        results.extend(value for _, value in sorted(close))
+        return results[:limit]
+
+# Function to build the autocomplete indexes for the search fields and crop names
+def build_suggestion_indexes(df, extra_crops=()):
+    def distinct(column):
+        if df is None or column not in df.columns:
+            return []
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return list(values.cat.categories)
+        return list(values.dropna().unique())
+
+    return {
+        'state': SuggestionIndex(distinct('State_Name')),
+        'district': SuggestionIndex(distinct('District_Name')),
+        'season': SuggestionIndex(distinct('Season')),
+        'crop': SuggestionIndex(distinct('Crop') + list(extra_crops))
+    }
+
+# Function to find matching rows based on input data
+def find_matching_rows(df, data, index=None):
+    if df is None:
+        return None
+    
+    data = [normalize_key(entry) for entry in data]  # Convert to lowercase and remove whitespace
+
+    # Use the prebuilt index when available instead of scanning every row
+    if index is not None:
+        return pd.Series(find_crops(index, *data), dtype=object, name='Crop')
+
+    matching_rows = df[
+        (df['State_Name'].str.strip().str.lower() == data[0]) &
+        (df['District_Name'].str.strip().str.lower() == data[1]) &
+        (df['Season'].str.strip().str.lower() == data[2])
+    ]
+    return matching_rows['Crop'] if 'Crop' in matching_rows.columns else pd.Series()
+
+# Function to parse a YYYY-MM-DD date, remembering recent results
+@functools.lru_cache(maxsize=4096)
+def parse_date(date_string):
+    return datetime.datetime.strptime(date_string, "%Y-%m-%d").date()
+
+# Function to calculate days since planting
+def calculate_days_since_planting(start_date):
+    try:
+        start_date_obj = parse_date(start_date)
+        today = datetime.datetime.now().date()
+        days_diff = (today - start_date_obj).days
+        return days_diff
+    except ValueError:
+        return None
+
+# Function to build, per crop, the sorted action day offsets and their actions for bisect lookups
+def build_fertilizer_index(actions):
+    index = {}
+    for crop, steps in actions.items():
+        offsets = sorted(steps)
+        index[crop] = (offsets, [steps[offset] for offset in offsets])
+    return index
+
+# Function to find the fertilizer actions falling between `since` and `until` (inclusive) for many plots.
+# Plots are (plot_id, crop, planting_date) tuples; the result is a list of (plot_id, day, action).
+def due_fertilizer_actions(plots, since, until):
+    due = []
+    for plot_id, crop, planting_date in plots:
+        offsets, actions = fertilizer_index.get(crop, ((), ()))
+        first = bisect.bisect_left(offsets, (since - planting_date).days)
+        last = bisect.bisect_right(offsets, (until - planting_date).days)
+        for i in range(first, last):
+            due.append((plot_id, offsets[i], actions[i]))
+    return due
+
+# Function to generate the dates from start to end (inclusive) every interval_days, as datetime64[D]
+def watering_dates(start_date, end_date, interval_days):
+    import_data_libraries()
+    return np.arange(
+        np.datetime64(start_date, 'D'),
+        np.datetime64(end_date, 'D') + 1,
+        np.timedelta64(interval_days, 'D')
+    )
+
+# Function to generate the watering dates of many plots at once;
+# returns the plot position of each date and the dates themselves
+def watering_schedules(start_dates, end_dates, interval_days):
+    import_data_libraries()
+    starts = np.asarray(start_dates, dtype='datetime64[D]')
+    ends = np.asarray(end_dates, dtype='datetime64[D]')
+    intervals = np.asarray(interval_days, dtype=np.int64)
+
+    counts = np.maximum((ends - starts).astype(np.int64) // intervals + 1, 0)
+    plots = np.repeat(np.arange(len(starts)), counts)
+    # Position of each date within its own plot's schedule
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    dates = starts[plots] + (steps * intervals[plots]).astype('timedelta64[D]')
+    return plots, dates
+
+# Function to compare the old per-date loop with watering_schedules and print the timings
+def benchmark_schedule_generation(plots=1000, days=180, interval_days=2):
+    import_data_libraries()
+    start = datetime.datetime(2024, 6, 1)
+    end = start + datetime.timedelta(days=days)
+
+    loop_start = time.perf_counter()
+    for _ in range(plots):
+        reminder_dates = []
+        current_date = start
+        while current_date <= end:
+            reminder_dates.append(current_date)
+            current_date += datetime.timedelta(days=interval_days)
+        success_message = ""
+        for date in reminder_dates:
+            success_message += f"- {date.strftime('%Y-%m-%d')}\n"
+    loop_seconds = time.perf_counter() - loop_start
+
+    vector_start = time.perf_counter()
+    _, dates = watering_schedules([start] * plots, [end] * plots, [interval_days] * plots)
+    np.datetime_as_string(dates, unit='D')
+    vector_seconds = time.perf_counter() - vector_start
+
+    print(json.dumps({
+        'plots': plots,
+        'dates': len(dates),
+        'loop_s': round(loop_seconds, 4),
+        'vectorized_s': round(vector_seconds, 4),
+        'speedup': round(loop_seconds / vector_seconds, 1) if vector_seconds else None
+    }))
+
+# Function to get the key prefix shared by the reminders of one watering schedule (crop, planting date)
+def watering_schedule_key(crop_name, start_date):
+    import_data_libraries()
+    return ('water', crop_name, str(np.datetime64(start_date, 'D')))
+
+# Function to compute the watering dates of one crop, and the reminders for those from `today` on.
+# Reminder keys are the schedule key plus the day, so two plantings of the same crop don't collide.
+def watering_reminders(crop_name, start_date, end_date, interval_days, today):
+    schedule_key = watering_schedule_key(crop_name, start_date)
+    dates = watering_dates(start_date, end_date, interval_days)
+    date_strings = np.datetime_as_string(dates, unit='D')
+    upcoming = dates >= np.datetime64(today, 'D')
+    reminders = list(zip(
+        (schedule_key + (day,) for day in date_strings[upcoming]),
+        dates[upcoming].astype('datetime64[s]').astype(datetime.datetime),
+        itertools.repeat(f"Water {crop_name}"),
+        itertools.repeat(f"Don't forget to water your {crop_name} today!"),
+        itertools.repeat('Crop Watering Reminder')
+    ))
+    return date_strings, reminders
+
+# Function to read a plot roster CSV (plot_id, crop, planting_date, harvest_date, watering_interval);
+# returns the usable plots and the number of rows skipped
+def load_plot_roster(file_path):
+    import_data_libraries()
+    roster = pd.read_csv(file_path, dtype={'plot_id': str, 'crop': str})
+    missing = {'plot_id', 'crop', 'planting_date', 'harvest_date'} - set(roster.columns)
+    if missing:
+        raise ValueError(f"Roster is missing columns: {', '.join(sorted(missing))}")
+
+    roster['planting_date'] = pd.to_datetime(roster['planting_date'], format="%Y-%m-%d", errors='coerce')
+    roster['harvest_date'] = pd.to_datetime(roster['harvest_date'], format="%Y-%m-%d", errors='coerce')
+
+    # Fall back to the crop's usual watering interval when the roster doesn't give one
+    default_interval = roster['crop'].map(
+        {crop: info['Watering Schedule']['Number of Days'] for crop, info in crop_data.items()}
+    )
+    if 'watering_interval' in roster.columns:
+        roster['watering_interval'] = pd.to_numeric(roster['watering_interval'], errors='coerce').fillna(default_interval)
+    else:
+        roster['watering_interval'] = default_interval
+
+    valid = (
+        roster[['plot_id', 'crop', 'planting_date', 'harvest_date', 'watering_interval']].notna().all(axis=1)
+        & (roster['watering_interval'] > 0)
+        & (roster['harvest_date'] >= roster['planting_date'])
+    )
+    roster = roster[valid].reset_index(drop=True)
+    roster['watering_interval'] = roster['watering_interval'].astype(int)
+    return roster, int((~valid).sum())
+
+# Function to compute every upcoming watering and fertilizer reminder for a roster in one pass
+def plot_reminders(roster, today):
+    # Watering: one row per plot and watering date
+    plots, dates = watering_schedules(roster['planting_date'], roster['harvest_date'], roster['watering_interval'])
+    water = roster.iloc[plots].assign(due=dates)
+    water = water[water['due'] >= today]
+
+    # Fertilizer: one row per (plot, action) from crop_actions
+    actions = pd.DataFrame(
+        [(crop, offset, action) for crop, steps in crop_actions.items() for offset, action in steps.items()],
+        columns=['crop', 'offset', 'action']
+    )
+    fertilize = roster.merge(actions, on='crop')
+    fertilize['due'] = fertilize['planting_date'] + pd.to_timedelta(fertilize['offset'], unit='D')
+    fertilize = fertilize[fertilize['due'] >= today]
+
+    reminders = list(zip(
+        zip(itertools.repeat('plot-water'), water['plot_id'], water['due'].dt.strftime('%Y-%m-%d')),
+        water['due'].to_numpy().astype('datetime64[s]').astype(datetime.datetime),
+        # One title per crop, so a firing sends one notification per crop rather than per plot
+        "Water " + water['crop'],
+        "Plot " + water['plot_id'] + ": Water today.",
+        itertools.repeat('Crop Watering Reminder')
+    ))
+    reminders += zip(
+        zip(itertools.repeat('plot-fertilize'), fertilize['plot_id'], fertilize['offset'].tolist()),
+        fertilize['due'].to_numpy().astype('datetime64[s]').astype(datetime.datetime),
+        "Fertilize " + fertilize['crop'],
+        "Plot " + fertilize['plot_id'] + ": " + fertilize['action'],
+        itertools.repeat('Crop Fertilizer Reminder')
+    )
+    return reminders
+
+# Function to check one knowledge base entry, raising ValueError naming the crop and field at fault
+def validate_crop_entry(name, entry):
+    if not isinstance(entry, dict) or not set(entry) <= {'info', 'fertilizer'}:
+        raise ValueError(f"{name}: entry must be an object with 'info' and/or 'fertilizer'")
+
+    info = entry.get('info')
+    if info is not None:
+        if not isinstance(info, dict):
+            raise ValueError(f"{name}: 'info' must be an object")
+        schedule = info.get('Watering Schedule')
+        if not isinstance(schedule, dict) or not isinstance(schedule.get('Frequency'), str):
+            raise ValueError(f"{name}: 'Watering Schedule' must be an object with a 'Frequency' string")
+        days = schedule.get('Number of Days')
+        # null marks crops whose interval varies
+        if days is not None and (type(days) is not int or days <= 0):
+            raise ValueError(f"{name}: 'Number of Days' must be a positive integer or null")
+        for field, value in info.items():
+            if field != 'Watering Schedule' and not isinstance(value, str):
+                raise ValueError(f"{name}: '{field}' must be a string")
+
+    steps = {}
+    for offset, action in entry.get('fertilizer', {}).items():
+        if not offset.isdigit():
+            raise ValueError(f"{name}: fertilizer day offset {offset!r} must be a non-negative integer")
+        if not isinstance(action, str):
+            raise ValueError(f"{name}: fertilizer action for day {offset} must be a string")
+        steps[int(offset)] = action
+    return info, steps
+
+# Crop facts and fertilizer schedules read from the versioned knowledge base file
+class CropKnowledge:
+    def __init__(self, file_path=KNOWLEDGE_PATH):
+        with open(file_path, encoding='utf-8') as f:
+            document = json.load(f)
+        if not isinstance(document, dict) or document.get('version') != KNOWLEDGE_VERSION:
+            raise ValueError(f"{file_path}: expected knowledge base version {KNOWLEDGE_VERSION}")
+        if not isinstance(document.get('crops'), dict):
+            raise ValueError(f"{file_path}: 'crops' must be an object")
+
+        self.crop_data = {}
+        self.crop_actions = {}
+        for name, entry in document['crops'].items():
+            info, steps = validate_crop_entry(name, entry)
+            if info is not None:
+                self.crop_data[name] = info
+            if steps:
+                self.crop_actions[name] = steps
+        self.fertilizer_index = build_fertilizer_index(self.crop_actions)
+
+# Loaded on first access, so importing the engine doesn't read the knowledge base
+knowledge = None
+
+# Function to return the knowledge base, loading it the first time it is needed
+def crop_knowledge():
+    global knowledge
+    if knowledge is None:
+        knowledge = CropKnowledge()
+    return knowledge
+
+# Function to swap in a freshly loaded knowledge base; readers see either the old one or the new one
+def use_crop_knowledge(new_knowledge):
+    global knowledge
+    knowledge = new_knowledge
+
+# Read-only view of one table of the knowledge base, so callers can keep using it like a dict
+class KnowledgeTable(collections.abc.Mapping):
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, key):
+        return getattr(crop_knowledge(), self._table)[key]
+
+    def __iter__(self):
+        return iter(getattr(crop_knowledge(), self._table))
+
+    def __len__(self):
+        return len(getattr(crop_knowledge(), self._table))
+
+# Crop information, fertilizer schedule (day offset -> action) and sorted offsets per crop
+crop_data = KnowledgeTable('crop_data')
+crop_actions = KnowledgeTable('crop_actions')
+fertilizer_index = KnowledgeTable('fertilizer_index')
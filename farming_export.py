@@ -0,0 +1,79 @@
+# Batch export of the crop search results for every (state, district, season) in the dataset
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+from farming_engine import CSV_PATH, district_season_report, file_signature, import_data_libraries, load_dataset
+
+# Output formats, chosen by the --format option or the output file's extension
+FORMATS = ('csv', 'json', 'parquet')
+
+# Function to build the report of one state's rows (run in a worker process)
+def state_report(args):
+    state_df, state_yields = args
+    import_data_libraries()
+    return district_season_report(state_df, state_yields)
+
+# Function to build the report for the whole table, optionally one state per worker process
+def build_report(df, yield_index, processes):
+    if processes <= 1:
+        return district_season_report(df, yield_index)
+
+    import pandas as pd
+    states = df['State_Name'].astype(str).str.strip().str.lower()
+    parts = []
+    # States in sorted order, so the parts concatenate in the same order as a single-process report
+    for state, state_df in df.groupby(states):
+        state_yields = {key: crops for key, crops in yield_index.items() if key[0] == state}
+        parts.append((state_df, state_yields))
+    with multiprocessing.Pool(processes) as pool:
+        reports = pool.map(state_report, parts)
+    return pd.concat(reports, ignore_index=True)
+
+# Function to write the report as CSV, JSON or Parquet
+def write_report(report, file_path, output_format):
+    if output_format == 'csv':
+        # One cell per field: the crop list is joined in ranking order
+        report.assign(Crops=report['Crops'].str.join("; ")).to_csv(file_path, index=False)
+    elif output_format == 'json':
+        report.to_json(file_path, orient='records', indent=2, force_ascii=False)
+    else:
+        report.to_parquet(file_path, index=False)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the crops found for every state, district and season, best yield first."
+    )
+    parser.add_argument("output", help="file to write (.csv, .json or .parquet)")
+    parser.add_argument("--format", choices=FORMATS, help="output format (default: from the file extension)")
+    parser.add_argument("--csv", default=CSV_PATH, help="crop production CSV to read")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="split the work by state across this many processes")
+    args = parser.parse_args()
+
+    output_format = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if output_format not in FORMATS:
+        parser.error(f"Cannot tell the format of {args.output}; use --format")
+
+    start = time.perf_counter()
+    df, _, yield_index = load_dataset(args.csv, file_signature(args.csv))
+    if df is None:
+        sys.exit(1)
+    loaded = time.perf_counter()
+
+    report = build_report(df, yield_index, args.processes)
+    try:
+        write_report(report, args.output, output_format)
+    except ImportError as e:
+        # Parquet needs pyarrow or fastparquet
+        print("Error occurred:", e)
+        sys.exit(1)
+    done = time.perf_counter()
+
+    print(f"Wrote {len(report)} district/season reports to {args.output} "
+          f"(load {loaded - start:.1f}s, report and write {done - loaded:.1f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Load test for farming_server: measures lookup throughput as the number of workers grows
+import argparse
+import asyncio
+import csv
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode
+
+from farming_engine import CSV_PATH
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "farming_server.py")
+
+# Queries used when no --queries file is given
+DEFAULT_QUERIES = [
+    ("Tamil Nadu", "Theni", "Kharif"),
+    ("Tamil Nadu", "Theni", "Rabi"),
+    ("Tamil Nadu", "Madurai", "Kharif"),
+    ("Kerala", "Idukki", "Whole Year"),
+    ("Karnataka", "Mysore", "Kharif"),
+]
+
+# Function to read (state, district, season) queries from a CSV file
+def load_queries(file_path):
+    with open(file_path, newline='') as f:
+        return [tuple(row[:3]) for row in csv.reader(f) if len(row) >= 3]
+
+# Function to send requests on one keep-alive connection until the deadline; returns the count
+async def client_connection(host, port, queries, deadline):
+    requests = [
+        f"GET /crops?{urlencode({'state': state, 'district': district, 'season': season})} HTTP/1.1\r\n"
+        f"Host: {host}\r\n\r\n".encode()
+        for state, district, season in queries
+    ]
+    reader, writer = await asyncio.open_connection(host, port)
+    count = 0
+    while time.perf_counter() < deadline:
+        writer.write(requests[count % len(requests)])
+        await writer.drain()
+        headers = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in headers.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":", 1)[1])
+        await reader.readexactly(length)
+        count += 1
+    writer.close()
+    return count
+
+# Function run in each client process: drive `connections` connections for `seconds`
+def client_process(host, port, connections, seconds, queries):
+    async def run():
+        deadline = time.perf_counter() + seconds
+        counts = await asyncio.gather(*(
+            client_connection(host, port, queries, deadline) for _ in range(connections)
+        ))
+        return sum(counts)
+    return asyncio.run(run())
+
+# Function to wait until the server answers /health
+def wait_for_server(host, port, timeout):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=1)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+# Function to start the server with `workers` processes and measure its throughput
+def run_load_test(workers, args, queries):
+    server = subprocess.Popen([
+        sys.executable, SERVER_SCRIPT, "--host", args.host, "--port", str(args.port),
+        "--csv", args.csv, "--workers", str(workers)
+    ])
+    try:
+        if not wait_for_server(args.host, args.port, args.startup_timeout):
+            raise RuntimeError(f"Server with {workers} workers did not start")
+        with multiprocessing.Pool(args.clients) as pool:
+            start = time.perf_counter()
+            counts = pool.starmap(
+                client_process,
+                [(args.host, args.port, args.connections, args.seconds, queries)] * args.clients
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    requests = sum(counts)
+    return {
+        'workers': workers,
+        'requests': requests,
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(requests / elapsed)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure farming_server throughput for several worker counts.")
+    parser.add_argument("--workers", default="1,2,4,8,16", help="comma-separated worker counts to test")
+    parser.add_argument("--clients", type=int, default=4, help="client processes generating load")
+    parser.add_argument("--connections", type=int, default=16, help="keep-alive connections per client process")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each run")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--csv", default=CSV_PATH, help="crop production CSV for the server to load")
+    parser.add_argument("--queries", help="CSV of state,district,season rows to query")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries) if args.queries else DEFAULT_QUERIES
+    for workers in (int(value) for value in args.workers.split(",")):
+        print(json.dumps(run_load_test(workers, args, queries)), flush=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Headless HTTP service answering crop lookups from the farming engine
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import tempfile
+from urllib.parse import parse_qs, urlsplit
+
+from farming_engine import (
+    CSV_PATH, YIELD_FIELDS, LRUCache, SharedCropIndex, SharedYieldIndex, crop_actions, crop_data, file_signature,
+    find_crops, load_dataset, normalize_key, ranked_crops, write_shared_index
+)
+
+# Search index, loaded once per process before the server starts accepting requests
+crop_index = {}
+yield_index = {}
+
+# Recent /crops answers, per process
+search_cache = LRUCache(maxsize=1024)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+# Function to answer a request path and its query parameters with (status, JSON body)
+def handle_query(path, params):
+    if path == "/crops":
+        missing = [name for name in ("state", "district", "season") if not params.get(name)]
+        if missing:
+            return 400, {"error": f"Missing parameters: {', '.join(missing)}"}
+        key = tuple(normalize_key(params[name]) for name in ("state", "district", "season"))
+        crops = search_cache.get(key, lambda: list(find_crops(crop_index, *key)))
+        return 200, {"crops": crops}
+
+    if path == "/recommend":
+        missing = [name for name in ("state", "district", "season") if not params.get(name)]
+        if missing:
+            return 400, {"error": f"Missing parameters: {', '.join(missing)}"}
+        try:
+            top = int(params.get("top", 5))
+        except ValueError:
+            return 400, {"error": "top must be an integer"}
+        if top < 1:
+            return 400, {"error": "top must be at least 1"}
+        ranked = ranked_crops(yield_index, params["state"], params["district"], params["season"], top)
+        return 200, {"recommendations": [
+            {"crop": crop, "mean_yield": mean_yield, "trend": trend if trend == trend else None,
+             "variance": variance, "years": years}
+            for crop, mean_yield, trend, variance, years in ranked
+        ]}
+
+    if path == "/crop":
+        name = params.get("name", "")
+        if name not in crop_data:
+            return 404, {"error": "Crop not found in database."}
+        return 200, {"name": name, "info": crop_data[name], "fertilizer": crop_actions.get(name, {})}
+
+    if path == "/health":
+        return 200, {"status": "ok", "keys": len(crop_index), "search_cache": search_cache.stats()}
+
+    return 404, {"error": "Not found"}
+
+# Function to read the request line and headers of the next request on a connection
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return request_line.decode("latin-1").split(), headers
+
+# Function to serve the requests of one client, keeping the connection open for HTTP/1.1
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            request = await read_request(reader)
+            if request is None:
+                break
+            parts, headers = request
+
+            keep_alive = False
+            if len(parts) != 3:
+                status, body = 400, {"error": "Malformed request line"}
+            elif parts[0] != "GET":
+                status, body = 405, {"error": "Only GET is supported"}
+            else:
+                method, target, version = parts
+                url = urlsplit(target)
+                params = {name: values[0] for name, values in parse_qs(url.query).items()}
+                status, body = handle_query(url.path, params)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+            payload = json.dumps(body).encode()
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+# Function to load the dataset once and serve lookups until interrupted
+async def serve(host, port, csv_path):
+    global crop_index, yield_index
+    loop = asyncio.get_running_loop()
+    df, crop_index, yield_index = await loop.run_in_executor(
+        None, load_dataset, csv_path, file_signature(csv_path)
+    )
+    if df is None:
+        print("Dataset could not be loaded; only /crop and /health will return data.")
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    print(f"Serving crop lookups on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+# Function run in each pre-forked worker: attach the shared indexes and serve on the shared socket
+def worker_main(sock, index_path, yield_path):
+    global crop_index, yield_index
+    crop_index = SharedCropIndex(index_path)
+    yield_index = SharedYieldIndex(yield_path)
+
+    async def run():
+        server = await asyncio.start_server(handle_connection, sock=sock)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+# Function to load the dataset once, write its search and yield indexes to memory-mapped files,
+# and start `workers` processes that all accept connections on one listening socket
+def serve_workers(host, port, csv_path, workers):
+    df, index, yields = load_dataset(csv_path, file_signature(csv_path))
+    if df is None:
+        print("Dataset could not be loaded; only /crop and /health will return data.")
+
+    fd, index_path = tempfile.mkstemp(suffix=".cropindex")
+    os.close(fd)
+    write_shared_index(index, index_path)
+    fd, yield_path = tempfile.mkstemp(suffix=".yieldindex")
+    os.close(fd)
+    write_shared_index(yields, yield_path, YIELD_FIELDS)
+    del df, index, yields  # Workers use the shared files, not the parent's copies
+
+    sock = socket.create_server((host, port))
+    processes = [
+        multiprocessing.Process(target=worker_main, args=(sock, index_path, yield_path), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    print(f"Serving crop lookups on http://{host}:{port} with {workers} workers")
+
+    # Stop the workers and remove the index files when terminated, not only on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+        sock.close()
+        os.remove(index_path)
+        os.remove(yield_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve crop recommendations over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--csv", default=CSV_PATH, help="crop production CSV to load")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes sharing the index file; 0 serves from this process's own dict index")
+    args = parser.parse_args()
+    if args.workers >= 1:
+        serve_workers(args.host, args.port, args.csv, args.workers)
+        return
+    try:
+        asyncio.run(serve(args.host, args.port, args.csv))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()